@@ -42,6 +42,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import List, Optional, Tuple
 
+from wgu_reddit_analyzer.utils import json_utils
 from wgu_reddit_analyzer.utils.logging_utils import get_logger
 from wgu_reddit_analyzer.utils.token_utils import count_tokens
 from wgu_reddit_analyzer.core.schema_definitions import SCHEMA_VERSION
@@ -118,7 +119,7 @@ def _open_jsonl(path: Path):
             if not line:
                 continue
             try:
-                yield json.loads(line)
+                yield json_utils.loads(line)
             except json.JSONDecodeError:
                 logger.warning("Skipping invalid JSON line")
                 continue
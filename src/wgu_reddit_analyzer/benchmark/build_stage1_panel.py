@@ -15,10 +15,11 @@ for FP/FN analysis, per-course breakdowns, and model/prompt comparison.
 
 import argparse
 import csv
-import json
 from pathlib import Path
 from typing import Dict, List, Any, Iterable
 
+from wgu_reddit_analyzer.utils import json_utils
+
 
 RUN_INDEX_CSV = Path("artifacts/benchmark/stage1_run_index.csv")
 GOLD_LABELS_CSV = Path("artifacts/benchmark/gold/gold_labels.csv")
@@ -100,7 +101,7 @@ def load_posts(split: str) -> Dict[str, Dict[str, Any]]:
             line = line.strip()
             if not line:
                 continue
-            obj = json.loads(line)
+            obj = json_utils.loads(line)
             pid = obj["post_id"]
             title = obj.get("title") or ""
             selftext = obj.get("selftext") or ""
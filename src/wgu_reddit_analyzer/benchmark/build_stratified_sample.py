@@ -45,6 +45,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+from wgu_reddit_analyzer.utils import json_utils
 from wgu_reddit_analyzer.utils.logging_utils import get_logger
 from wgu_reddit_analyzer.utils.token_utils import count_tokens
 from wgu_reddit_analyzer.core.schema_definitions import SCHEMA_VERSION
@@ -219,7 +220,7 @@ def read_stage0_candidates(
             stage0_total += 1
 
             try:
-                rec = json.loads(line)
+                rec = json_utils.loads(line)
             except json.JSONDecodeError:
                 LOGGER.warning(
                     "Skipping invalid JSON line at index %s.",
@@ -45,6 +45,8 @@ from collections import defaultdict
 from pathlib import Path
 from typing import Dict, List
 
+from wgu_reddit_analyzer.utils import json_utils
+
 
 def load_gold_labels(gold_path: Path, split: str) -> Dict[str, Dict]:
     """
@@ -86,15 +88,13 @@ def load_candidates(candidates_path: Path) -> Dict[str, Dict]:
             "full_post_text": str,
         }
     """
-    import json as _json
-
     candidates: Dict[str, Dict] = {}
     with candidates_path.open("r", encoding="utf-8") as f:
         for line in f:
             line = line.strip()
             if not line:
                 continue
-            obj = _json.loads(line)
+            obj = json_utils.loads(line)
             post_id = obj["post_id"]
             course_code = obj.get("course_code") or ""
             title = obj.get("title") or ""
@@ -46,6 +46,7 @@ from wgu_reddit_analyzer.benchmark.model_registry import (
     MODEL_REGISTRY,
     get_model_info,
 )
+from wgu_reddit_analyzer.utils import json_utils
 from wgu_reddit_analyzer.utils.logging_utils import get_logger
 from wgu_reddit_analyzer.utils.token_utils import count_tokens
 
@@ -239,7 +240,7 @@ def avg_post_tokens_from_jsonl(path: Path, model_name: str) -> float:
             if not stripped:
                 continue
             try:
-                rec = json.loads(stripped)
+                rec = json_utils.loads(stripped)
             except json.JSONDecodeError:
                 continue
 
@@ -35,6 +35,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+from wgu_reddit_analyzer.utils import json_utils
 from wgu_reddit_analyzer.utils.logging_utils import get_logger
 from wgu_reddit_analyzer.core.schema_definitions import SCHEMA_VERSION
 
@@ -94,7 +95,7 @@ def read_jsonl_candidates(path: Path, split: str) -> List[Candidate]:
             if not line:
                 continue
             try:
-                rec = json.loads(line)
+                rec = json_utils.loads(line)
             except json.JSONDecodeError:
                 continue
             post_id = (rec.get("post_id") or "").strip()
@@ -12,9 +12,17 @@ Responsibility:
 This is the single entry point Stage 1 code should use:
     generate(model_name: str, prompt: str) -> LlmCallResult
 
+Callers that re-run identical prompts (Stage 2 clustering) can use an
+on-disk response cache keyed by (model_name, prompt):
+    generate_cached(model_name, prompt, cache_dir) -> LlmCallResult
+
+Deadline-insensitive callers (Stage 2 clustering) may instead submit many
+prompts at once through the OpenAI Batch API:
+    generate_batch(model_name: str, prompts: Dict[str, str]) -> Dict[str, LlmCallResult]
+
 Features:
     - Per-call timeout.
-    - Simple retry with exponential backoff.
+    - Retry with capped exponential backoff and full jitter.
     - llm_failure / num_retries / error_message flags on LlmCallResult.
 
 Decoding:
@@ -24,9 +32,15 @@ Decoding:
 
 from __future__ import annotations
 
+import json
+import os
+import random
+import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
-from typing import Any, Tuple
+from hashlib import blake2b
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
 
 from wgu_reddit_analyzer.utils.config_loader import get_config
 from wgu_reddit_analyzer.benchmark.model_registry import get_model_info
@@ -42,6 +56,24 @@ logger = get_logger("benchmark.model_client")
 
 DEFAULT_TIMEOUT_SEC = 90.0
 MAX_RETRIES = 2
+BACKOFF_BASE_SEC = 1.0
+BACKOFF_CAP_SEC = 30.0
+
+# OpenAI Batch API: jobs complete within 24h and are billed at half price.
+BATCH_COMPLETION_WINDOW = "24h"
+BATCH_COST_MULTIPLIER = 0.5
+BATCH_POLL_INTERVAL_SEC = 30.0
+BATCH_TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+
+def _backoff_delay(attempt: int) -> float:
+    """
+    Full-jitter backoff: uniform in [0, min(cap, base * 2**attempt)].
+
+    Jitter spreads retries out so bursts of 429/5xx responses from a shared
+    provider do not re-collide on the same schedule.
+    """
+    return random.uniform(0.0, min(BACKOFF_CAP_SEC, BACKOFF_BASE_SEC * (2**attempt)))
 
 
 def _call_model_once(
@@ -85,9 +117,9 @@ def _call_model_with_retry(
     for attempt in range(max_retries + 1):
         try:
             if attempt > 0:
-                backoff = 2**attempt
+                backoff = _backoff_delay(attempt)
                 logger.warning(
-                    "Retrying model call model=%s provider=%s attempt=%d backoff=%ds",
+                    "Retrying model call model=%s provider=%s attempt=%d backoff=%.2fs",
                     model_name,
                     provider,
                     attempt,
@@ -209,4 +241,195 @@ def generate(model_name: str, prompt: str) -> LlmCallResult:
         timeout_sec=DEFAULT_TIMEOUT_SEC,
         started_at=started_at,
         finished_at=finished_at,
-    )
\ No newline at end of file
+    )
+
+
+def _cache_path(cache_dir: Path, model_name: str, prompt: str) -> Path:
+    h = blake2b(digest_size=20)
+    h.update(model_name.encode("utf-8"))
+    h.update(b"\x00")
+    h.update(prompt.encode("utf-8"))
+    return cache_dir / f"{h.hexdigest()}.json"
+
+
+def cache_lookup(model_name: str, prompt: str, cache_dir: Path) -> Optional[LlmCallResult]:
+    """
+    Return a zero-cost LlmCallResult for a previously cached (model, prompt), or None.
+    """
+    path = _cache_path(cache_dir, model_name, prompt)
+    if not path.is_file():
+        return None
+    try:
+        record = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError) as e:
+        logger.warning("Ignoring unreadable cache entry %s: %s", path, e)
+        return None
+
+    now = time.time()
+    return LlmCallResult(
+        model_name=model_name,
+        provider=record.get("provider", ""),
+        raw_text=record.get("raw_text", ""),
+        input_tokens=int(record.get("input_tokens", 0)),
+        output_tokens=int(record.get("output_tokens", 0)),
+        total_cost_usd=0.0,
+        elapsed_sec=0.0,
+        started_at=now,
+        finished_at=now,
+        cache_hit=True,
+    )
+
+
+def cache_store(prompt: str, result: LlmCallResult, cache_dir: Path) -> None:
+    """
+    Persist a successful result. Written to a temp file then renamed, so a
+    crash never leaves a truncated entry behind. Failures are not cached.
+    """
+    if result.llm_failure or result.cache_hit:
+        return
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    path = _cache_path(cache_dir, result.model_name, prompt)
+    record = {
+        "model_name": result.model_name,
+        "provider": result.provider,
+        "raw_text": result.raw_text,
+        "input_tokens": result.input_tokens,
+        "output_tokens": result.output_tokens,
+        "total_cost_usd": result.total_cost_usd,
+        "created_at_epoch": time.time(),
+    }
+    tmp_path = path.with_suffix(f".{os.getpid()}_{threading.get_ident()}.tmp")
+    tmp_path.write_text(json.dumps(record, ensure_ascii=False), encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def generate_cached(model_name: str, prompt: str, cache_dir: Optional[Path]) -> LlmCallResult:
+    """
+    generate() with an exact-match on-disk cache keyed by (model_name, prompt).
+
+    A fresh result is not stored: the caller passes it to cache_store() once
+    the response has parsed and validated, so a bad reply is never replayed.
+    With cache_dir=None this is just generate().
+    """
+    if cache_dir is None:
+        return generate(model_name, prompt)
+
+    cached = cache_lookup(model_name, prompt, cache_dir)
+    if cached is not None:
+        logger.info("LLM cache hit model=%s", model_name)
+        return cached
+
+    return generate(model_name, prompt)
+
+
+def _batch_response_text(record: Dict[str, Any]) -> Tuple[str, str | None]:
+    """
+    Pull the assistant text (or an error message) out of one Batch API output line.
+    """
+    error = record.get("error")
+    if error:
+        return "", f"BatchError: {error}"
+
+    response = record.get("response") or {}
+    if response.get("status_code") != 200:
+        return "", f"BatchError: status_code={response.get('status_code')}"
+
+    choices = (response.get("body") or {}).get("choices") or []
+    if not choices:
+        return "", None
+    content = (choices[0].get("message") or {}).get("content")
+    return (content or "").strip(), None
+
+
+def generate_batch(
+    model_name: str,
+    prompts: Dict[str, str],
+    poll_interval_sec: float = BATCH_POLL_INTERVAL_SEC,
+) -> Dict[str, LlmCallResult]:
+    """
+    Run many prompts through the OpenAI Batch API in a single job.
+
+    Parameters
+    ----------
+    model_name : str
+        Registry key for an OpenAI model.
+    prompts : Dict[str, str]
+        custom_id -> fully rendered prompt text.
+    poll_interval_sec : float, optional
+        Seconds between batch status checks.
+
+    Returns
+    -------
+    Dict[str, LlmCallResult]
+        One result per custom_id. Missing or errored responses are returned
+        with llm_failure=True rather than raised.
+    """
+    cfg = get_config()
+    info = get_model_info(model_name)
+    if info.provider != "openai":
+        raise RuntimeError(f"Batch API is only supported for OpenAI models, got provider={info.provider}")
+    if not cfg.openai_api_key:
+        raise RuntimeError("OPENAI_API_KEY (or equivalent) is missing; cannot call OpenAI models.")
+
+    from openai import OpenAI
+
+    client = OpenAI(api_key=cfg.openai_api_key)
+    started_at = time.time()
+
+    lines = [
+        json.dumps(
+            {
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {"model": model_name, "messages": [{"role": "user", "content": prompt}]},
+            },
+            ensure_ascii=False,
+        )
+        for custom_id, prompt in prompts.items()
+    ]
+    payload = ("\n".join(lines) + "\n").encode("utf-8")
+
+    batch_file = client.files.create(file=("batch_input.jsonl", payload), purpose="batch")
+    batch = client.batches.create(
+        input_file_id=batch_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window=BATCH_COMPLETION_WINDOW,
+    )
+    logger.info("Submitted batch id=%s model=%s requests=%d", batch.id, model_name, len(prompts))
+
+    while batch.status not in BATCH_TERMINAL_STATUSES:
+        time.sleep(poll_interval_sec)
+        batch = client.batches.retrieve(batch.id)
+        logger.info("Batch id=%s status=%s counts=%s", batch.id, batch.status, batch.request_counts)
+
+    finished_at = time.time()
+    elapsed = finished_at - started_at
+
+    outputs: Dict[str, Tuple[str, str | None]] = {}
+    if batch.output_file_id:
+        for line in client.files.content(batch.output_file_id).text.splitlines():
+            if line.strip():
+                record = json.loads(line)
+                outputs[record.get("custom_id", "")] = _batch_response_text(record)
+    if batch.status != "completed":
+        logger.error("Batch id=%s ended with status=%s", batch.id, batch.status)
+
+    results: Dict[str, LlmCallResult] = {}
+    for custom_id, prompt in prompts.items():
+        raw_text, error_message = outputs.get(custom_id, ("", f"No batch output (status={batch.status})"))
+        cdict = estimate_cost(prompt, raw_text, model_name).to_dict()
+        results[custom_id] = LlmCallResult(
+            model_name=model_name,
+            provider=info.provider,
+            raw_text=raw_text,
+            input_tokens=cdict.get("input_tokens", 0),
+            output_tokens=cdict.get("output_tokens", 0),
+            total_cost_usd=round(cdict.get("total_cost_usd", 0.0) * BATCH_COST_MULTIPLIER, 6),
+            elapsed_sec=elapsed,
+            llm_failure=error_message is not None,
+            error_message=error_message,
+            started_at=started_at,
+            finished_at=finished_at,
+        )
+    return results
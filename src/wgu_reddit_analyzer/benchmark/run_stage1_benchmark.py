@@ -51,6 +51,7 @@ from wgu_reddit_analyzer.benchmark.stage1_types import (
     Stage1PredictionOutput,
 )
 from wgu_reddit_analyzer.core.schema_definitions import SCHEMA_VERSION
+from wgu_reddit_analyzer.utils import json_utils
 
 # Logger fallback: prefer project logger; fallback to stdlib logging.
 try:
@@ -166,7 +167,7 @@ def load_candidates(candidates_path: Path) -> Dict[str, Stage1PredictionInput]:
             line = line.strip()
             if not line:
                 continue
-            obj = json.loads(line)
+            obj = json_utils.loads(line)
             post_id = obj["post_id"]
             course_code = obj.get("course_code") or ""
             title = obj.get("title") or ""
@@ -75,14 +75,16 @@ def _extract_json_block(text: str) -> str:
     return s
 
 
+_CONTAINS_PAINPOINT_RE = re.compile(r'"contains_painpoint"\s*:\s*"([ynu])"', re.IGNORECASE)
+
+
 def _regex_contains_painpoint(text: str) -> tuple[str | None, bool]:
     """
     Try to extract an unambiguous y/n/u from a contains_painpoint field.
 
     Returns (label, ambiguous_flag).
     """
-    pattern = r'"contains_painpoint"\s*:\s*"([ynu])"'
-    matches = re.findall(pattern, text, flags=re.IGNORECASE)
+    matches = _CONTAINS_PAINPOINT_RE.findall(text)
 
     if not matches:
         return None, False
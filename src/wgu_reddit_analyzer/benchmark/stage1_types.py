@@ -63,6 +63,9 @@ class LlmCallResult(BaseModel):
     error_message: str | None = None
     timeout_sec: float | None = None
 
+    # True when raw_text was served from a local response cache (no API call)
+    cache_hit: bool = False
+
     # Timing metadata
     started_at: float | None = None
     finished_at: float | None = None
\ No newline at end of file
@@ -145,7 +145,6 @@ def log_run(started_at: float, finished_at: float, summary: dict) -> None:
     )
 
     conn.commit()
-    conn.close()
 
 
 def main() -> int:
@@ -86,7 +86,6 @@ def fetch_comments(post_ids):
             print(f"[ERROR] fetching comments for post {post_id}: {e}")
             failures += 1
 
-    conn.close()
     return {
         "comments_inserted": inserted_comments,
         "duration": round(time() - start_time, 2),
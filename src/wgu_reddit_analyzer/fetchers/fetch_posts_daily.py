@@ -89,7 +89,6 @@ def fetch_posts(limit_per_sub: int = MAX_POSTS_PER_SUB) -> Dict[str, Any]:
     conn = get_db_connection()
     post_cols = set(_get_posts_columns(conn))
     if not post_cols:
-        conn.close()
         return {"stage": "posts", "posts_fetched": 0, "failures": 1, "duration_sec": 0.0}
 
     cur = conn.cursor()
@@ -174,7 +173,6 @@ def fetch_posts(limit_per_sub: int = MAX_POSTS_PER_SUB) -> Dict[str, Any]:
             logger.warning("Error fetching posts for /r/%s: %s: %s", name, type(exc).__name__, exc)
 
     conn.commit()
-    conn.close()
 
     duration = round(time.time() - start, 2)
     logger.info("New Posts Inserted=%s Failures=%s Duration=%.2fs", total_new, failures, duration)
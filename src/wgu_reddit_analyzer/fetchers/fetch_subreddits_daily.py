@@ -134,8 +134,6 @@ def fetch_subreddits():
 
             failures += 1
 
-    conn.close()
-
     return {
         "subreddit_stats_fetched": fetched_stats,
         "duration": round(time() - start_time, 2),
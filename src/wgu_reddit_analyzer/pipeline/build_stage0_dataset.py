@@ -27,15 +27,16 @@ Artifact:
 
 from __future__ import annotations
 
+import argparse
 import json
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, List
 
 import pandas as pd
 
 from wgu_reddit_analyzer.utils import filters
 from wgu_reddit_analyzer.utils.db import get_db_connection
-from wgu_reddit_analyzer.utils.sentiment_vader import calculate_vader_sentiment
+from wgu_reddit_analyzer.utils.sentiment_vader import calculate_vader_sentiment_batch
 
 try:
     from wgu_reddit_analyzer.utils.logging_utils import get_logger  # type: ignore
@@ -116,7 +117,9 @@ def _load_course_codes() -> List[str]:
     Load normalized course codes from the configured course list CSV.
 
     The CSV path is defined by wgu_reddit_analyzer.utils.filters.COURSE_CSV. Codes are
-    read from the "CourseCode" column and normalized via string conversion and strip.
+    read from the "CourseCode" column via filters.load_course_codes (parsed once per
+    file version and shared with the course filter) and normalized via string
+    conversion and strip.
 
     Returns:
         List of non-empty course codes. Returns an empty list if the file is missing
@@ -128,12 +131,12 @@ def _load_course_codes() -> List[str]:
         return []
 
     try:
-        df_codes = pd.read_csv(csv_path, usecols=["CourseCode"])
+        raw_codes = filters.load_course_codes(csv_path)
     except Exception as exc:  # noqa: BLE001
         logger.error("Failed to read course list CSV at %s: %s", csv_path, exc)
         return []
 
-    codes = df_codes["CourseCode"].dropna().astype(str).str.strip().tolist()
+    codes = [str(code).strip() for code in raw_codes]
     codes = [code for code in codes if code]
 
     logger.info("Loaded %d course codes from %s", len(codes), csv_path)
@@ -143,15 +146,33 @@ def _load_course_codes() -> List[str]:
     return codes
 
 
-def _ensure_vader(df: pd.DataFrame) -> pd.DataFrame:
+def _stripped_text(df: pd.DataFrame, col: str) -> pd.Series:
+    """
+    Return df[col] with non-string cells as "" and surrounding whitespace removed.
+
+    Args:
+        df: Source DataFrame.
+        col: Text column name; a missing column yields all "".
+
+    Returns:
+        Object Series aligned with df.index.
+    """
+    if col not in df.columns:
+        return pd.Series("", index=df.index, dtype=object)
+    values = df[col]
+    return values.where(values.map(type).eq(str), "").astype(object).str.strip()
+
+
+def _ensure_vader(df: pd.DataFrame, n_jobs: int = 1) -> pd.DataFrame:
     """
     Ensure the DataFrame has a numeric vader_compound score for each row.
 
     If vader_compound is missing or not castable to float, the score is recomputed
-    using calculate_vader_sentiment over the combined title and selftext.
+    using calculate_vader_sentiment_batch over the combined title and selftext.
 
     Args:
         df: DataFrame containing at least title and selftext columns.
+        n_jobs: Worker processes for rescoring (see calculate_vader_sentiment_batch).
 
     Returns:
         The same DataFrame with a vader_compound column present and best-effort
@@ -169,7 +190,16 @@ def _ensure_vader(df: pd.DataFrame) -> pd.DataFrame:
         except (TypeError, ValueError):
             return True
 
-    mask = df["vader_compound"].apply(needs_vader)
+    scores = df["vader_compound"]
+    if (
+        pd.api.types.is_float_dtype(scores)
+        or pd.api.types.is_integer_dtype(scores)
+        or pd.api.types.is_bool_dtype(scores)
+    ):
+        # float() accepts every cell of a numeric column, NaN included.
+        mask = pd.Series(False, index=df.index)
+    else:
+        mask = scores.apply(needs_vader)
     missing_count = int(mask.sum())
 
     if missing_count > 0:
@@ -178,17 +208,13 @@ def _ensure_vader(df: pd.DataFrame) -> pd.DataFrame:
             missing_count,
         )
 
-        def combined_text(row: Dict[str, Any]) -> str:
-            title = row.get("title") or ""
-            body = row.get("selftext") or ""
-            if not isinstance(title, str):
-                title = ""
-            if not isinstance(body, str):
-                body = ""
-            return f"{title.strip()} {body.strip()}".strip()
-
-        texts = df.loc[mask].apply(combined_text, axis=1)
-        df.loc[mask, "vader_compound"] = texts.apply(calculate_vader_sentiment)
+        subset = df.loc[mask]
+        texts = (
+            _stripped_text(subset, "title") + " " + _stripped_text(subset, "selftext")
+        ).str.strip()
+        df.loc[mask, "vader_compound"] = calculate_vader_sentiment_batch(
+            texts.tolist(), n_jobs=n_jobs
+        )
 
     try:
         df["vader_compound"] = df["vader_compound"].astype(float)
@@ -198,7 +224,7 @@ def _ensure_vader(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
-def build_stage0_dataset(output_path: Path) -> int:
+def build_stage0_dataset(output_path: Path, n_jobs: int = 1) -> int:
     """
     Build and write the Stage 0 dataset to a JSON Lines file.
 
@@ -208,17 +234,16 @@ def build_stage0_dataset(output_path: Path) -> int:
 
     Args:
         output_path: Destination path for the JSONL output file.
+        n_jobs: Worker processes for course matching and VADER rescoring
+            (1 runs in-process, <= 0 uses every CPU). Output is identical.
 
     Returns:
         Number of records written to output_path. If no eligible records are found,
         an empty file is written and 0 is returned.
     """
     conn = get_db_connection()
-    try:
-        logger.info("Loading base posts from DB with structural filters.")
-        df = pd.read_sql_query(BASE_QUERY, conn)
-    finally:
-        conn.close()
+    logger.info("Loading base posts from DB with structural filters.")
+    df = pd.read_sql_query(BASE_QUERY, conn)
 
     logger.info("Base query returned %d rows.", len(df))
     if df.empty:
@@ -242,6 +267,7 @@ def build_stage0_dataset(output_path: Path) -> int:
         title_col="title",
         text_col="selftext",
         out_col="matched_course_codes",
+        n_jobs=n_jobs,
     )
     after_filter = len(df)
     logger.info(
@@ -253,13 +279,16 @@ def build_stage0_dataset(output_path: Path) -> int:
         output_path.write_text("", encoding="utf-8")
         return 0
 
-    df["course_code_count"] = df["matched_course_codes"].apply(len)
-    df["course_code"] = df["matched_course_codes"].apply(
-        lambda values: values[0] if values else None,
-    )
+    matched = df["matched_course_codes"].str
+    df["course_code_count"] = matched.len()
+    # Rows without a code get NaN here and are dropped by the count check below.
+    df["course_code"] = matched[0]
 
     before_exact = len(df)
-    df = df[df["course_code_count"] == 1].copy()
+    exact = df["course_code_count"] == 1
+    if not exact.all():
+        # _ensure_vader writes into df, so a filtered slice must be its own frame.
+        df = df[exact].copy()
     logger.info(
         "Enforced course_code_count == 1: %d -> %d posts.",
         before_exact,
@@ -269,10 +298,10 @@ def build_stage0_dataset(output_path: Path) -> int:
         output_path.write_text("", encoding="utf-8")
         return 0
 
-    df = _ensure_vader(df)
+    df = _ensure_vader(df, n_jobs=n_jobs)
 
     before_sent = len(df)
-    df = df[df["vader_compound"] < -0.2].copy()
+    df = df[df["vader_compound"] < -0.2]
     logger.info(
         "Applied negative sentiment filter (vader_compound < -0.2): %d -> %d posts.",
         before_sent,
@@ -306,33 +335,53 @@ def build_stage0_dataset(output_path: Path) -> int:
         "extra_metadata",
         "captured_at",
     ]
-    for col in ("is_promotional", "is_removed", "is_deleted"):
-        if col not in df.columns:
-            df[col] = 0
+    missing_flags = {
+        col: 0
+        for col in ("is_promotional", "is_removed", "is_deleted")
+        if col not in df.columns
+    }
+    if missing_flags:
+        df = df.assign(**missing_flags)
 
     cols = [col for col in cols if col in df.columns]
     df = df[cols]
 
-    count = 0
+    # One object-array conversion yields the same native values iterrows()
+    # produced, without building a Series per row.
+    columns = df.columns.tolist()
+    encode = json.JSONEncoder(ensure_ascii=False).encode
     with output_path.open("w", encoding="utf-8") as file:
-        for _, row in df.iterrows():
-            json.dump(row.to_dict(), file, ensure_ascii=False)
-            file.write("\n")
-            count += 1
+        file.writelines(
+            encode(dict(zip(columns, values))) + "\n"
+            for values in df.to_numpy(dtype=object)
+        )
+    count = len(df)
 
     logger.info("Stage 0 export complete: %d records written to %s", count, output_path)
     return count
 
 
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Build the Stage 0 dataset.")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for course matching and VADER (0 = all CPUs).",
+    )
+    return parser.parse_args()
+
+
 def main() -> None:
     """
     Build the Stage 0 dataset using the default artifacts location.
 
     Writes artifacts/stage0_filtered_posts.jsonl under the inferred repository root.
     """
+    args = parse_args()
     artifacts_dir = _artifacts_dir()
     output_path = artifacts_dir / STAGE0_FILENAME
-    build_stage0_dataset(output_path)
+    build_stage0_dataset(output_path, n_jobs=args.jobs)
 
 
 if __name__ == "__main__":
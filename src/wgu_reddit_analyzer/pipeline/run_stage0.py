@@ -22,6 +22,7 @@ Notes:
 
 from __future__ import annotations
 
+import argparse
 import json
 import logging
 from datetime import datetime, timezone
@@ -170,12 +171,24 @@ def _write_manifest(run_dir: Path, output_path: Path, written: int) -> None:
         json.dump(manifest, file, indent=2)
 
 
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run the Stage 0 build and record run metadata.")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for course matching and VADER (0 = all CPUs).",
+    )
+    return parser.parse_args()
+
+
 def main() -> None:
     """
     Run the Stage 0 build and record run metadata.
 
     Skips execution if Stage 0 is locked.
     """
+    args = parse_args()
     artifacts_dir = _artifacts_dir()
 
     if _is_stage0_locked(artifacts_dir):
@@ -193,7 +206,7 @@ def main() -> None:
     logger.info("Starting Stage 0 rebuild with run_id=%s", run_id)
     logger.info("Authoritative output: %s", stage0_path)
 
-    written = build_stage0_dataset(stage0_path)
+    written = build_stage0_dataset(stage0_path, n_jobs=args.jobs)
     logger.info("Stage 0 build completed. Records written: %d", written)
 
     _write_manifest(run_dir, stage0_path, written)
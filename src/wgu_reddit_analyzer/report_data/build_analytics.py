@@ -42,9 +42,13 @@ import json
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 
+import numpy as np
 import pandas as pd
 
 from wgu_reddit_analyzer.core.schema_definitions import SCHEMA_VERSION
+from wgu_reddit_analyzer.utils.logging_utils import get_logger
+
+logger = get_logger("report_data.build_analytics")
 
 
 # ---------------------------------------------------------------------------
@@ -65,12 +69,48 @@ def ensure_dir(path: Path) -> None:
 # Loaders
 # ---------------------------------------------------------------------------
 
+def _read_jsonl_with_parquet_mirror(path: Path) -> pd.DataFrame:
+    """
+    Read a JSONL artifact through a Parquet copy next to it.
+
+    The copy (<name>.parquet) is (re)written whenever it is missing or older
+    than the JSONL, so later reads skip the row-by-row JSON parse. Without
+    pyarrow, or when the frame cannot be stored as Parquet (e.g. a column
+    mixing strings, lists and dicts), this is a plain pd.read_json.
+    """
+    try:
+        import pyarrow as pa
+    except ImportError:
+        return pd.read_json(path, lines=True)
+
+    pq_path = path.with_suffix(".parquet")
+    if pq_path.exists() and pq_path.stat().st_mtime >= path.stat().st_mtime:
+        df = pd.read_parquet(pq_path)
+        # Parquet list columns come back as numpy arrays; restore the lists
+        # read_json produces (e.g. matched_course_codes) so outputs match.
+        for col in df.columns[df.dtypes == object]:
+            non_null = df[col].dropna()
+            if not non_null.empty and isinstance(non_null.iloc[0], np.ndarray):
+                df[col] = [v.tolist() if isinstance(v, np.ndarray) else v for v in df[col]]
+        return df
+
+    df = pd.read_json(path, lines=True)
+    tmp_path = pq_path.with_name(pq_path.name + ".tmp")
+    try:
+        df.to_parquet(tmp_path, compression="zstd", index=False)
+        tmp_path.replace(pq_path)
+    except (pa.ArrowException, OSError) as e:
+        tmp_path.unlink(missing_ok=True)
+        logger.warning("Not caching %s as Parquet: %s", path, e)
+    return df
+
+
 def load_stage0_filtered(artifacts_dir: Path) -> pd.DataFrame:
     """Load the locked Stage 0 filtered posts."""
     path = artifacts_dir / "stage0_filtered_posts.jsonl"
     if not path.exists():
         raise FileNotFoundError(f"Missing Stage 0 file: {path}")
-    df = pd.read_json(path, lines=True)
+    df = _read_jsonl_with_parquet_mirror(path)
     if "post_id" not in df.columns:
         raise ValueError("stage0_filtered_posts.jsonl missing 'post_id'")
     return df
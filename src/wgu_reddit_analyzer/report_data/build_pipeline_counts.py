@@ -17,12 +17,13 @@ python src/wgu_reddit_analyzer/report_data/build_pipeline_counts.py --report-dat
 """
 
 import argparse
-import json
 from pathlib import Path
 from typing import Optional, Tuple
 
 import pandas as pd
 
+from wgu_reddit_analyzer.utils import json_utils
+
 # Logger fallback: prefer project logger; fallback to stdlib logging.
 try:
     from wgu_reddit_analyzer.utils.logging_utils import get_logger  # type: ignore
@@ -39,8 +40,9 @@ def _load_post_master(report_data_dir: Path) -> pd.DataFrame:
     path = report_data_dir / "post_master.csv"
     if not path.exists():
         raise FileNotFoundError(f"Missing post_master.csv at {path}")
-    df = pd.read_csv(path)
     required = {"post_id", "course_code", "is_pain_point", "course_title_final", "college_list"}
+    # Only the columns used for counting are materialized.
+    df = pd.read_csv(path, usecols=lambda c: c in required)
     missing = required - set(df.columns)
     if missing:
         raise ValueError(f"post_master.csv is missing required columns: {sorted(missing)}")
@@ -58,7 +60,7 @@ def _load_course_cluster_detail(report_data_dir: Path) -> pd.DataFrame:
             line = line.strip()
             if not line:
                 continue
-            records.append(json.loads(line))
+            records.append(json_utils.loads(line))
 
     if not records:
         return pd.DataFrame()
@@ -70,8 +72,9 @@ def _load_issue_course_matrix(report_data_dir: Path) -> pd.DataFrame:
     path = report_data_dir / "issue_course_matrix.csv"
     if not path.exists():
         return pd.DataFrame(columns=["normalized_issue_label", "course_code", "num_posts", "num_clusters"])
-    df = pd.read_csv(path)
-    for col in ["normalized_issue_label", "course_code", "num_posts", "num_clusters"]:
+    wanted = ["normalized_issue_label", "course_code", "num_posts", "num_clusters"]
+    df = pd.read_csv(path, usecols=lambda c: c in wanted)
+    for col in wanted:
         if col not in df.columns:
             if col in ("num_posts", "num_clusters"):
                 df[col] = 0
@@ -84,8 +87,9 @@ def _load_global_issues(report_data_dir: Path) -> pd.DataFrame:
     path = report_data_dir / "global_issues.csv"
     if not path.exists():
         return pd.DataFrame(columns=["global_cluster_id", "normalized_issue_label"])
-    df = pd.read_csv(path)
-    for col in ["global_cluster_id", "normalized_issue_label"]:
+    wanted = ["global_cluster_id", "normalized_issue_label"]
+    df = pd.read_csv(path, usecols=lambda c: c in wanted)
+    for col in wanted:
         if col not in df.columns:
             df[col] = None
     return df[["global_cluster_id", "normalized_issue_label"]]
@@ -106,8 +110,9 @@ def _load_stage2_painpoints_table(repo_root: Path) -> pd.DataFrame:
     path = repo_root / "artifacts" / "stage2" / "painpoints_llm_friendly.csv"
     if not path.exists():
         return pd.DataFrame(columns=["post_id", "course_code"])
-    df = pd.read_csv(path, dtype=str).fillna("")
-    for col in ["post_id", "course_code"]:
+    wanted = ["post_id", "course_code"]
+    df = pd.read_csv(path, dtype=str, usecols=lambda c: c in wanted).fillna("")
+    for col in wanted:
         if col not in df.columns:
             df[col] = ""
     df["post_id"] = df["post_id"].astype(str)
@@ -297,9 +302,10 @@ def _write_overview(
     gi_df = _load_global_issues(report_data_dir)
     icm = _load_issue_course_matrix(report_data_dir)
 
-    total_stage0_posts = int(course_counts["stage0_posts"].sum())
-    total_stage1_pain = int(course_counts["stage1_painpoints"].sum())
-    total_stage2_clusters = int(course_counts["stage2_clusters"].sum())
+    # Whole-column totals: reduce the underlying arrays directly.
+    total_stage0_posts = int(course_counts["stage0_posts"].to_numpy().sum())
+    total_stage1_pain = int(course_counts["stage1_painpoints"].to_numpy().sum())
+    total_stage2_clusters = int(course_counts["stage2_clusters"].to_numpy().sum())
 
     # Prefer a true corpus-wide unique count of global issues.
     if not gi_df.empty:
@@ -312,7 +318,7 @@ def _write_overview(
     else:
         total_global_issues = int(icm["normalized_issue_label"].nunique()) if not icm.empty else 0
 
-    num_courses_with_pain = int((course_counts["stage1_painpoints"] > 0).sum())
+    num_courses_with_pain = int((course_counts["stage1_painpoints"].to_numpy() > 0).sum())
 
     exploded_colleges = course_counts.copy()
     exploded_colleges["college"] = exploded_colleges["college"].fillna("Unknown").astype(str)
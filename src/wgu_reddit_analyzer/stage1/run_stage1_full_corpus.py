@@ -12,8 +12,12 @@ Reads
 Writes (single run directory)
 - predictions_FULL.csv
   One row per post with pain-point decision and extracted fields
+- predictions_FULL.parquet (only when pyarrow is installed)
+  Same rows as the CSV, for faster Stage 2 reads
 - raw_io_FULL.jsonl
-  One record per model call (prompt, response, error flags)
+  One record per post (prompt, response, error flags); posts whose
+  (course_code, text) repeats an earlier post reuse its response and
+  carry duplicate_of
 - manifest.json
   Run provenance: inputs, counts, timing, cost, environment
 - prompt_used.txt
@@ -23,6 +27,10 @@ Normal usage:
   python src/wgu_reddit_analyzer/stage1/run_stage1_full_corpus.py \
     --model <model_name> --output-dir <output_dir>
 
+Resume an interrupted run (skips post_ids already in predictions_FULL.csv):
+  python src/wgu_reddit_analyzer/stage1/run_stage1_full_corpus.py \
+    --model <model_name> --output-dir <output_dir> --resume
+
 Demo usage:
   python src/wgu_reddit_analyzer/stage1/run_stage1_full_corpus.py \
     --model llama3 --limit 10 --output-dir _demo
@@ -41,14 +49,15 @@ import time
 import traceback
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from hashlib import sha256
+from hashlib import blake2b, sha256
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from wgu_reddit_analyzer.benchmark.model_registry import get_model_info
 from wgu_reddit_analyzer.benchmark.stage1_classifier import build_prompt, classify_post, load_prompt_template
 from wgu_reddit_analyzer.benchmark.stage1_types import LlmCallResult, Stage1PredictionInput, Stage1PredictionOutput
 from wgu_reddit_analyzer.core.schema_definitions import SCHEMA_VERSION
+from wgu_reddit_analyzer.utils import json_utils
 from wgu_reddit_analyzer.utils.logging_utils import get_logger
 
 logger = get_logger("stage1.run_stage1_full_corpus")
@@ -57,6 +66,27 @@ DEFAULT_STAGE0_JSONL = Path("artifacts/stage0_filtered_posts.jsonl")
 DEFAULT_OUT_ROOT = Path("artifacts/stage1/full_corpus")
 DEFAULT_PROMPT_PATH = Path("prompts/s1_optimal.txt")
 
+# Circuit breaker: after this many consecutive failed calls, pause before
+# issuing more requests so a provider outage does not burn through the corpus.
+DEFAULT_BREAKER_THRESHOLD = 5
+DEFAULT_BREAKER_COOLDOWN_SEC = 60.0
+
+# Log progress and flush predictions_FULL.csv every N posts.
+DEFAULT_PROGRESS_EVERY = 25
+
+PREDICTION_FIELDNAMES = [
+    "post_id",
+    "course_code",
+    "pred_contains_painpoint",
+    "root_cause_summary_pred",
+    "pain_point_snippet_pred",
+    "confidence_pred",
+    "parse_error",
+    "schema_error",
+    "used_fallback",
+    "llm_failure",
+]
+
 
 @dataclass(frozen=True)
 class GitInfo:
@@ -117,6 +147,31 @@ def _write_jsonl_append(path: Path, record: Dict[str, Any]) -> None:
         f.write("\n")
 
 
+def _write_parquet_if_available(csv_path: Path, path: Path) -> bool:
+    """
+    Convert the finished predictions CSV to zstd-compressed Parquet when
+    pyarrow is installed.
+
+    Returns True if the file was written. The CSV stays the canonical artifact;
+    the Parquet copy only speeds up the Stage 2 handoff.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+        import pyarrow.parquet as pq
+    except ImportError:
+        logger.info("pyarrow not installed; skipping %s", path.name)
+        return False
+
+    convert_options = pacsv.ConvertOptions(
+        column_types={name: pa.string() for name in PREDICTION_FIELDNAMES[:5]},
+        strings_can_be_null=False,
+    )
+    table = pacsv.read_csv(csv_path, convert_options=convert_options)
+    pq.write_table(table, path, compression="zstd")
+    return True
+
+
 def _ensure_run_dir(out_root: Path, run_slug: str, run_id: str) -> Path:
     out_root.mkdir(parents=True, exist_ok=True)
     stamp = _utc_timestamp_compact()
@@ -169,7 +224,7 @@ def load_full_corpus_inputs(
             if not line:
                 continue
 
-            obj = json.loads(line)
+            obj = json_utils.loads(line)
             post_id = (obj.get("post_id") or "").strip()
             if not post_id:
                 continue
@@ -200,6 +255,66 @@ def load_full_corpus_inputs(
     return items, post_ids_in_order
 
 
+def _load_done_post_ids(predictions_path: Path) -> set[str]:
+    """
+    Return post_ids already written to a (possibly partial) predictions CSV.
+
+    A hard kill can leave the last row cut off mid-field. The file is
+    truncated back to the end of its last complete record, so appended rows
+    start on a fresh line and the cut-off post is classified again.
+    """
+    if not predictions_path.is_file():
+        return set()
+
+    data = predictions_path.read_bytes()
+    pos = 0  # byte offset of the end of the lines the reader has consumed
+
+    def lines() -> Iterator[str]:
+        nonlocal pos
+        for line in data.splitlines(keepends=True):
+            pos += len(line)
+            # A kill can also split a multi-byte character; that line is
+            # incomplete anyway and gets dropped below.
+            yield line.decode("utf-8", errors="replace")
+
+    done: set[str] = set()
+    complete = 0
+    pid_col: Optional[int] = None
+    try:
+        for row in csv.reader(lines(), strict=True):
+            # Every record DictWriter writes ends with a line terminator.
+            if data[pos - 1 : pos] != b"\n":
+                break
+            complete = pos
+            if not row:
+                continue
+            if pid_col is None:
+                pid_col = row.index("post_id") if "post_id" in row else -1
+            elif 0 <= pid_col < len(row) and row[pid_col]:
+                done.add(row[pid_col])
+    except csv.Error:
+        pass
+
+    if complete < len(data):
+        logger.warning(
+            "Truncating incomplete last record of %s (%d bytes dropped)",
+            predictions_path,
+            len(data) - complete,
+        )
+        with predictions_path.open("r+b") as f:
+            f.truncate(complete)
+    return done
+
+
+def _dedupe_key(example: Stage1PredictionInput) -> str:
+    """Stable content key for a post: identical (course_code, text) pairs collide."""
+    h = blake2b(digest_size=16)
+    h.update(example.course_code.encode("utf-8"))
+    h.update(b"\x00")
+    h.update(example.text.encode("utf-8"))
+    return h.hexdigest()
+
+
 def _normalize_confidence(value: Any) -> float:
     try:
         x = float(value)
@@ -228,15 +343,23 @@ def run_stage1_full_corpus(
     debug: bool = False,
     dry_run: bool = False,
     overwrite: bool = False,
+    breaker_threshold: int = DEFAULT_BREAKER_THRESHOLD,
+    breaker_cooldown_sec: float = DEFAULT_BREAKER_COOLDOWN_SEC,
+    dedupe: bool = True,
+    resume: bool = False,
+    progress_every: int = DEFAULT_PROGRESS_EVERY,
 ) -> None:
     # Validate inputs early (fail fast)
     if not prompt_path.is_file():
         raise FileNotFoundError(f"Prompt template not found at {prompt_path}")
     if not input_path.is_file():
         raise FileNotFoundError(f"Input JSONL not found at {input_path}")
+    if resume and output_dir is None:
+        raise RuntimeError("--resume requires --output-dir pointing at the interrupted run.")
 
     # Load model metadata and prompt; hash inputs for provenance
     info = get_model_info(model_name)
+    provider = getattr(info, "provider", "")
     prompt_template = load_prompt_template(prompt_path)
     prompt_sha256 = _sha256_file(prompt_path)
     input_sha256 = _sha256_file(input_path)
@@ -252,25 +375,31 @@ def run_stage1_full_corpus(
 
     # Resolve output directory (explicit vs auto-generated)
     if output_dir is not None:
-        _prepare_output_dir_explicit(output_dir, overwrite=overwrite)
+        _prepare_output_dir_explicit(output_dir, overwrite=overwrite or resume)
         run_dir = output_dir
     else:
         run_dir = _ensure_run_dir(out_root=out_root, run_slug=run_slug, run_id=run_id)
 
     # Define run artifact paths
     predictions_path = run_dir / "predictions_FULL.csv"
+    predictions_parquet_path = run_dir / "predictions_FULL.parquet"
     manifest_path = run_dir / "manifest.json"
     raw_io_path = run_dir / "raw_io_FULL.jsonl"
     prompt_copy_path = run_dir / "prompt_used.txt"
 
+    # Resume: post_ids already classified by an earlier, interrupted invocation
+    done_ids = _load_done_post_ids(predictions_path) if resume else set()
+
     # Dry run: print configuration only, no model calls
     if dry_run:
         print("DRY RUN")
         print(f"model_name: {model_name}")
-        print(f"provider: {getattr(info, 'provider', '')}")
+        print(f"provider: {provider}")
         print(f"prompt_path: {prompt_path} (sha256={prompt_sha256})")
         print(f"input_path: {input_path} (sha256={input_sha256})")
         print(f"num_posts: {len(examples)}")
+        if resume:
+            print(f"num_resumed: {len(done_ids)}")
         print(f"run_dir: {run_dir}")
         return
 
@@ -283,13 +412,12 @@ def run_stage1_full_corpus(
     git = _get_git_info(repo_root)
 
     logger.info("Stage 1 full-corpus starting")
-    logger.info("model=%s provider=%s", model_name, getattr(info, "provider", ""))
+    logger.info("model=%s provider=%s", model_name, provider)
     logger.info("prompt=%s (sha256=%s)", str(prompt_path), prompt_sha256)
     logger.info("input=%s (sha256=%s) posts=%d", str(input_path), input_sha256, len(examples))
     logger.info("run_dir=%s", str(run_dir))
 
-    # Initialize aggregates and error counters
-    rows_for_csv: List[Dict[str, Any]] = []
+    # Initialize aggregates and error counters (rows stream to disk, not memory)
     total_cost = 0.0
     total_elapsed = 0.0
     had_failures = False
@@ -298,140 +426,203 @@ def run_stage1_full_corpus(
     num_schema_errors = 0
     num_fallbacks = 0
     num_llm_failures = 0
+    num_retries_total = 0
+    num_breaker_trips = 0
+    consecutive_failures = 0
+    num_duplicates = 0
+    num_resumed = 0
+    num_called = 0
+
+    # Successful results keyed by (course_code, text) content hash, so
+    # crossposts and duplicate scrapes reuse the first call's prediction.
+    first_result_by_key: Dict[str, Tuple[str, Stage1PredictionOutput, LlmCallResult]] = {}
 
     started_at = time.time()
 
-    # Main loop: one post → one model call
-    for call_index, example in enumerate(examples):
-        prompt_text = build_prompt(prompt_template, example)
+    # A Parquet copy left by an earlier run no longer matches the CSV about
+    # to be written; it is regenerated once this run completes.
+    predictions_parquet_path.unlink(missing_ok=True)
 
-        call_started = time.time()
-        exc_text: Optional[str] = None
-        exc_tb: Optional[str] = None
+    append = bool(done_ids)
+    with predictions_path.open("a" if append else "w", encoding="utf-8", newline="") as predictions_f:
+        writer = csv.DictWriter(predictions_f, fieldnames=PREDICTION_FIELDNAMES)
+        if not append:
+            writer.writeheader()
 
-        # Call classifier; fail soft on exceptions
-        try:
-            pred_obj, llm_result = classify_post(
-                model_name=model_name,
-                example=example,
-                prompt_template=prompt_template,
-                debug=debug,
-            )
-        except Exception as exc:  # noqa: BLE001
-            had_failures = True
-            exc_text = f"{type(exc).__name__}: {exc}"
-            exc_tb = traceback.format_exc(limit=50)
-
-            llm_result = LlmCallResult(  # type: ignore[call-arg]
-                model_name=model_name,
-                provider=getattr(info, "provider", ""),
-                raw_text="",
-                total_cost_usd=0.0,
-                elapsed_sec=(time.time() - call_started),
-                started_at=call_started,
-                finished_at=time.time(),
-                llm_failure=True,
-            )
-            pred_obj = Stage1PredictionOutput(  # type: ignore[call-arg]
-                post_id=example.post_id,
-                course_code=example.course_code,
-                contains_painpoint="u",
-                root_cause_summary="",
-                pain_point_snippet="",
-                confidence=0.0,
-                parse_error=False,
-                schema_error=False,
-                used_fallback=False,
+        # Main loop: one unique post → one model call
+        for call_index, example in enumerate(examples):
+            if example.post_id in done_ids:
+                num_resumed += 1
+                continue
+
+            prompt_text = build_prompt(prompt_template, example)
+
+            call_started = time.time()
+            exc_text: Optional[str] = None
+            exc_tb: Optional[str] = None
+            duplicate_of: Optional[str] = None
+
+            key = _dedupe_key(example) if dedupe else ""
+            cached = first_result_by_key.get(key) if dedupe else None
+
+            # Call classifier; fail soft on exceptions
+            try:
+                if cached is not None:
+                    duplicate_of, pred_obj, llm_result = cached
+                    num_duplicates += 1
+                else:
+                    pred_obj, llm_result = classify_post(
+                        model_name=model_name,
+                        example=example,
+                        prompt_template=prompt_template,
+                        debug=debug,
+                    )
+                    if dedupe and not llm_result.llm_failure:
+                        first_result_by_key[key] = (example.post_id, pred_obj, llm_result)
+            except Exception as exc:  # noqa: BLE001
+                had_failures = True
+                exc_text = f"{type(exc).__name__}: {exc}"
+                exc_tb = traceback.format_exc(limit=50)
+
+                llm_result = LlmCallResult(
+                    model_name=model_name,
+                    provider=provider,
+                    raw_text="",
+                    input_tokens=0,
+                    output_tokens=0,
+                    total_cost_usd=0.0,
+                    elapsed_sec=(time.time() - call_started),
+                    started_at=call_started,
+                    finished_at=time.time(),
+                    llm_failure=True,
+                )
+                pred_obj = Stage1PredictionOutput(
+                    post_id=example.post_id,
+                    course_code=example.course_code,
+                    contains_painpoint="u",
+                    root_cause_summary="",
+                    pain_point_snippet="",
+                    confidence=0.0,
+                    raw_response="",
+                    parse_error=False,
+                    schema_error=False,
+                    used_fallback=False,
+                )
+            # Read each flag once; both output records reuse these locals
+            parse_error = pred_obj.parse_error
+            schema_error = pred_obj.schema_error
+            used_fallback = pred_obj.used_fallback
+            llm_failure = llm_result.llm_failure
+
+            # Timing, cost, and error counters (duplicates reuse a call already counted)
+            call_cost = 0.0 if duplicate_of else float(llm_result.total_cost_usd or 0.0)
+            call_elapsed = 0.0 if duplicate_of else float(llm_result.elapsed_sec or 0.0)
+            total_cost += call_cost
+            total_elapsed += call_elapsed
+
+            if parse_error:
+                num_parse_errors += 1
+            if schema_error:
+                num_schema_errors += 1
+            if used_fallback:
+                num_fallbacks += 1
+            if llm_failure:
+                num_llm_failures += 1
+                consecutive_failures += 1
+            else:
+                consecutive_failures = 0
+
+            retry_count = 0 if duplicate_of else llm_result.num_retries
+            num_retries_total += retry_count
+
+            # Circuit breaker: back off once the provider looks unhealthy
+            if breaker_threshold > 0 and consecutive_failures >= breaker_threshold:
+                num_breaker_trips += 1
+                logger.warning(
+                    "Circuit breaker tripped after %d consecutive failures; pausing %.1fs",
+                    consecutive_failures,
+                    breaker_cooldown_sec,
+                )
+                time.sleep(breaker_cooldown_sec)
+                consecutive_failures = 0
+
+            # Normalize label and confidence
+            pred_label = pred_obj.contains_painpoint.lower() or "u"
+            if pred_label not in {"y", "n", "u"}:
+                pred_label = "u"
+
+            confidence_val = _normalize_confidence(pred_obj.confidence)
+
+            writer.writerow(
+                {
+                    "post_id": example.post_id,
+                    "course_code": example.course_code,
+                    "pred_contains_painpoint": pred_label,
+                    "root_cause_summary_pred": pred_obj.root_cause_summary,
+                    "pain_point_snippet_pred": pred_obj.pain_point_snippet,
+                    "confidence_pred": confidence_val,
+                    "parse_error": parse_error,
+                    "schema_error": schema_error,
+                    "used_fallback": used_fallback,
+                    "llm_failure": llm_failure,
+                }
             )
-        # Timing, cost, and error counters
-        total_cost += float(getattr(llm_result, "total_cost_usd", 0.0) or 0.0)
-        total_elapsed += float(getattr(llm_result, "elapsed_sec", 0.0) or 0.0)
-
-        if bool(getattr(pred_obj, "parse_error", False)):
-            num_parse_errors += 1
-        if bool(getattr(pred_obj, "schema_error", False)):
-            num_schema_errors += 1
-        if bool(getattr(pred_obj, "used_fallback", False)):
-            num_fallbacks += 1
-        if bool(getattr(llm_result, "llm_failure", False)):
-            num_llm_failures += 1
-
-        # Normalize label and confidence
-        pred_label = (getattr(pred_obj, "contains_painpoint", "") or "").lower() or "u"
-        if pred_label not in {"y", "n", "u"}:
-            pred_label = "u"
-
-        confidence_val = _normalize_confidence(getattr(pred_obj, "confidence", None))
-
-        rows_for_csv.append(
-            {
+
+            raw_record: Dict[str, Any] = {
+                "run_id": run_id,
+                "run_slug": run_slug,
+                "run_tag": run_tag,
+                "call_index": call_index,
                 "post_id": example.post_id,
                 "course_code": example.course_code,
-                "pred_contains_painpoint": pred_label,
-                "root_cause_summary_pred": getattr(pred_obj, "root_cause_summary", "") or "",
-                "pain_point_snippet_pred": getattr(pred_obj, "pain_point_snippet", "") or "",
+                "model_name": model_name,
+                "provider": provider,
+                "split": "FULL",
+                "prompt_name": prompt_name,
+                "prompt_sha256": prompt_sha256,
+                "prompt_text": prompt_text,
+                "raw_response_text": llm_result.raw_text,
+                "started_at_epoch": float(llm_result.started_at or call_started),
+                "finished_at_epoch": float(llm_result.finished_at or time.time()),
+                "elapsed_sec": call_elapsed,
+                "total_cost_usd": call_cost,
                 "confidence_pred": confidence_val,
-                "parse_error": bool(getattr(pred_obj, "parse_error", False)),
-                "schema_error": bool(getattr(pred_obj, "schema_error", False)),
-                "used_fallback": bool(getattr(pred_obj, "used_fallback", False)),
-                "llm_failure": bool(getattr(llm_result, "llm_failure", False)),
+                "parse_error": parse_error,
+                "schema_error": schema_error,
+                "used_fallback": used_fallback,
+                "llm_failure": llm_failure,
+                "retry_count": retry_count,
             }
-        )
-
-        raw_record: Dict[str, Any] = {
-            "run_id": run_id,
-            "run_slug": run_slug,
-            "run_tag": run_tag,
-            "call_index": call_index,
-            "post_id": example.post_id,
-            "course_code": example.course_code,
-            "model_name": model_name,
-            "provider": getattr(info, "provider", ""),
-            "split": "FULL",
-            "prompt_name": prompt_name,
-            "prompt_sha256": prompt_sha256,
-            "prompt_text": prompt_text,
-            "raw_response_text": getattr(llm_result, "raw_text", "") or "",
-            "started_at_epoch": float(getattr(llm_result, "started_at", call_started) or call_started),
-            "finished_at_epoch": float(getattr(llm_result, "finished_at", time.time()) or time.time()),
-            "elapsed_sec": float(getattr(llm_result, "elapsed_sec", 0.0) or 0.0),
-            "total_cost_usd": float(getattr(llm_result, "total_cost_usd", 0.0) or 0.0),
-            "confidence_pred": confidence_val,
-            "parse_error": bool(getattr(pred_obj, "parse_error", False)),
-            "schema_error": bool(getattr(pred_obj, "schema_error", False)),
-            "used_fallback": bool(getattr(pred_obj, "used_fallback", False)),
-            "llm_failure": bool(getattr(llm_result, "llm_failure", False)),
-        }
-        if exc_text:
-            raw_record["exception"] = exc_text
-        if exc_tb:
-            raw_record["exception_traceback"] = exc_tb
-
-        _write_jsonl_append(raw_io_path, raw_record)
+            if duplicate_of:
+                raw_record["duplicate_of"] = duplicate_of
+            if exc_text:
+                raw_record["exception"] = exc_text
+            if exc_tb:
+                raw_record["exception_traceback"] = exc_tb
+
+            _write_jsonl_append(raw_io_path, raw_record)
+
+            # Checkpoint: rows on disk are what --resume skips next time
+            num_called += 1
+            if progress_every > 0 and num_called % progress_every == 0:
+                predictions_f.flush()
+                elapsed = time.time() - started_at
+                logger.info(
+                    "Progress %d/%d posts (resumed=%d) wallclock=%.1fs rate=%.2f/s cost_usd=%.6f",
+                    num_called + num_resumed,
+                    len(examples),
+                    num_resumed,
+                    elapsed,
+                    num_called / elapsed if elapsed > 0 else 0.0,
+                    total_cost,
+                )
 
     finished_at = time.time()
     wallclock = finished_at - started_at
     num_examples = len(examples)
-    avg_elapsed_sec_per_example = (total_elapsed / num_examples) if num_examples > 0 else 0.0
-
-    with predictions_path.open("w", encoding="utf-8", newline="") as f:
-        writer = csv.DictWriter(
-            f,
-            fieldnames=[
-                "post_id",
-                "course_code",
-                "pred_contains_painpoint",
-                "root_cause_summary_pred",
-                "pain_point_snippet_pred",
-                "confidence_pred",
-                "parse_error",
-                "schema_error",
-                "used_fallback",
-                "llm_failure",
-            ],
-        )
-        writer.writeheader()
-        writer.writerows(rows_for_csv)
+    avg_elapsed_sec_per_example = (total_elapsed / num_called) if num_called > 0 else 0.0
+
+    wrote_parquet = _write_parquet_if_available(predictions_path, predictions_parquet_path)
 
     selection: Dict[str, Any] = {
         "limit": limit,
@@ -452,7 +643,7 @@ def run_stage1_full_corpus(
         "run_slug": run_slug,
         "run_tag": run_tag,
         "model_name": model_name,
-        "provider": getattr(info, "provider", ""),
+        "provider": provider,
         "prompt_name": prompt_name,
         "prompt_template_path": str(prompt_path),
         "prompt_sha256": prompt_sha256,
@@ -465,6 +656,7 @@ def run_stage1_full_corpus(
         "outputs": {
             "run_dir": str(run_dir),
             "predictions_path": str(predictions_path),
+            "predictions_parquet_path": str(predictions_parquet_path) if wrote_parquet else None,
             "raw_io_path": str(raw_io_path),
         },
         "counts": {
@@ -473,6 +665,10 @@ def run_stage1_full_corpus(
             "num_schema_errors": int(num_schema_errors),
             "num_llm_failures": int(num_llm_failures),
             "num_fallbacks": int(num_fallbacks),
+            "num_retries": int(num_retries_total),
+            "num_breaker_trips": int(num_breaker_trips),
+            "num_duplicates_reused": int(num_duplicates),
+            "num_resumed": int(num_resumed),
         },
         "timing": {
             "started_at_epoch": float(started_at),
@@ -483,7 +679,7 @@ def run_stage1_full_corpus(
         },
         "cost": {
             "total_cost_usd": float(total_cost),
-            "avg_cost_usd_per_example": (float(total_cost) / num_examples) if num_examples > 0 else 0.0,
+            "avg_cost_usd_per_example": (float(total_cost) / num_called) if num_called > 0 else 0.0,
         },
         "environment": {
             "python": sys.version.split()[0],
@@ -523,6 +719,34 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--run-tag", default="final", help="Run tag label (for provenance only).")
     parser.add_argument("--debug", action="store_true", help="Enable verbose debug logging of prompts and model outputs.")
     parser.add_argument("--dry-run", action="store_true", help="Validate inputs and print planned run without LLM calls or writes.")
+    parser.add_argument(
+        "--breaker-threshold",
+        type=int,
+        default=DEFAULT_BREAKER_THRESHOLD,
+        help="Consecutive failed calls before pausing (0 disables the circuit breaker).",
+    )
+    parser.add_argument(
+        "--breaker-cooldown-sec",
+        type=float,
+        default=DEFAULT_BREAKER_COOLDOWN_SEC,
+        help="Seconds to pause when the circuit breaker trips.",
+    )
+    parser.add_argument(
+        "--no-dedupe",
+        action="store_true",
+        help="Call the model for every post even when (course_code, text) repeats an earlier post.",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue an interrupted run in --output-dir, skipping post_ids already in predictions_FULL.csv.",
+    )
+    parser.add_argument(
+        "--progress-every",
+        type=int,
+        default=DEFAULT_PROGRESS_EVERY,
+        help="Log progress and flush predictions every N posts (0 disables).",
+    )
     return parser.parse_args()
 
 
@@ -541,6 +765,11 @@ def main() -> None:
         debug=args.debug,
         dry_run=args.dry_run,
         overwrite=args.overwrite,
+        breaker_threshold=args.breaker_threshold,
+        breaker_cooldown_sec=args.breaker_cooldown_sec,
+        dedupe=not args.no_dedupe,
+        resume=args.resume,
+        progress_every=args.progress_every,
     )
 
 
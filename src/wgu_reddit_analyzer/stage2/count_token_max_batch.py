@@ -12,6 +12,9 @@ For each course_code:
     - sum tokens across all rows for that course
 
 Then print the course(s) with the highest total token count.
+
+If preprocess_painpoints.py already wrote painpoints_course_tokens.csv, the
+per-course totals are read from there instead of re-tokenizing every row.
 """
 
 from __future__ import annotations
@@ -39,11 +42,18 @@ def default_csv_path() -> Path:
     return project_root() / "artifacts" / "stage2" / "painpoints_full_for_clustering.csv"
 
 
-def main() -> None:
-    csv_path = default_csv_path()
-    if not csv_path.exists():
-        raise SystemExit(f"CSV not found: {csv_path}")
+def default_course_tokens_path() -> Path:
+    return project_root() / "artifacts" / "stage2" / "painpoints_course_tokens.csv"
+
+
+def load_course_tokens(tokens_path: Path) -> Dict[str, int]:
+    """Read per-course totals written by preprocess_painpoints.py."""
+    with tokens_path.open("r", encoding="utf-8") as f:
+        return {row["course_code"]: int(row["total_tokens"]) for row in csv.DictReader(f)}
+
 
+def count_course_tokens(csv_path: Path) -> Dict[str, int]:
+    """Tokenize every painpoint row and sum per course."""
     # course_code -> total token count
     course_tokens: Dict[str, int] = defaultdict(int)
 
@@ -72,6 +82,20 @@ def main() -> None:
             tokens = count_tokens(text)
             course_tokens[course_code] += tokens
 
+    return course_tokens
+
+
+def main() -> None:
+    tokens_path = default_course_tokens_path()
+    csv_path = default_csv_path()
+    if tokens_path.exists():
+        csv_path = tokens_path
+        course_tokens = load_course_tokens(tokens_path)
+    elif csv_path.exists():
+        course_tokens = count_course_tokens(csv_path)
+    else:
+        raise SystemExit(f"CSV not found: {csv_path}")
+
     if not course_tokens:
         raise SystemExit("No valid rows found with text and course_code.")
 
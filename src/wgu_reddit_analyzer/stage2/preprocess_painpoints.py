@@ -6,9 +6,14 @@ Inputs (relative to repo root)
     artifacts/stage1/full_corpus/LATEST/predictions_FULL.csv
   Optional override:
     --input-predictions PATH
+  If a predictions_FULL.parquet sibling exists and pyarrow is installed, it is
+  read instead of the CSV (same rows, typed columns).
 
 Outputs (relative to repo root)
   artifacts/stage2/painpoints_llm_friendly.csv
+  artifacts/stage2/painpoints_course_tokens.csv
+    Per-course painpoint and token totals (summary + "\n" + snippet),
+    computed in the same pass so the batch-budget check needs no re-read
   artifacts/stage2/manifest.json
 
 Filtering rules
@@ -31,16 +36,20 @@ import json
 import os
 from collections import defaultdict
 from datetime import datetime, timezone
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Iterator, Tuple
 
+from wgu_reddit_analyzer.utils.token_utils import count_tokens_batch
 
 REPO_ROOT = Path(__file__).resolve().parents[3]
 
 DEFAULT_INPUT_REL = Path("artifacts/stage1/full_corpus/LATEST/predictions_FULL.csv")
 DEFAULT_OUTPUT_REL = Path("artifacts/stage2/painpoints_llm_friendly.csv")
+DEFAULT_COURSE_TOKENS_REL = Path("artifacts/stage2/painpoints_course_tokens.csv")
 DEFAULT_MANIFEST_REL = Path("artifacts/stage2/manifest.json")
 
+# Order matters: _iter_prediction_rows yields tuples in this column order.
 _REQUIRED_COLUMNS = [
     "post_id",
     "course_code",
@@ -90,7 +99,9 @@ def _require_relpath(p: Path, arg_name: str) -> Path:
     return (REPO_ROOT / p).resolve()
 
 
-def _flag_is_true(value: str | None) -> bool:
+def _flag_is_true(value: str | bool | None) -> bool:
+    if isinstance(value, bool):
+        return value
     return (value or "").strip().lower() in _TRUE_VALUES
 
 
@@ -102,58 +113,144 @@ def _validate_header(fieldnames: list[str] | None) -> None:
         raise SystemExit(f"Input CSV is missing required columns: {', '.join(missing)}")
 
 
-def prepare_painpoints(input_csv: Path, output_csv: Path) -> Dict[str, Any]:
-    output_csv.parent.mkdir(parents=True, exist_ok=True)
+def _parquet_sibling(input_csv: Path) -> Path | None:
+    """
+    Return the Parquet copy of input_csv if it exists, is at least as new as
+    the CSV, and pyarrow is importable.
+    """
+    parquet_path = input_csv.with_suffix(".parquet")
+    if not parquet_path.is_file() or parquet_path.stat().st_mtime < input_csv.stat().st_mtime:
+        return None
+    try:
+        import pyarrow.parquet  # noqa: F401
+    except ImportError:
+        return None
+    return parquet_path
 
-    painpoints: list[dict[str, str]] = []
-    total = 0
-    drop_reasons: dict[str, int] = defaultdict(int)
 
-    with input_csv.open("r", newline="", encoding="utf-8") as f_in:
-        reader = csv.DictReader(f_in)
-        _validate_header(reader.fieldnames)
+def _iter_prediction_rows(input_csv: Path) -> Iterator[Tuple[Any, ...]]:
+    """
+    Yield Stage 1 prediction rows as tuples in _REQUIRED_COLUMNS order.
 
-        for row in reader:
-            total += 1
+    Prefers the Parquet sibling when usable. Tuples (rather than dicts) let
+    the filter loop unpack straight into locals instead of doing per-row
+    key lookups.
+    """
+    parquet_path = _parquet_sibling(input_csv)
+    if parquet_path is not None:
+        import pyarrow.parquet as pq
 
-            if row.get("pred_contains_painpoint") != "y":
-                drop_reasons["not_painpoint"] += 1
-                continue
+        table = pq.read_table(parquet_path)
+        _validate_header(table.column_names)
+        columns = [col.to_pylist() for col in table.select(_REQUIRED_COLUMNS).columns]
+        yield from zip(*columns)
+        return
 
-            if any(_flag_is_true(row.get(flag)) for flag in ("parse_error", "schema_error", "used_fallback", "llm_failure")):
-                drop_reasons["error_flagged"] += 1
+    with input_csv.open("r", newline="", encoding="utf-8") as f_in:
+        reader = csv.reader(f_in)
+        header = next(reader, None)
+        _validate_header(header)
+        width = len(header)
+        pick = itemgetter(*[header.index(c) for c in _REQUIRED_COLUMNS])
+        for rec in reader:
+            if not rec:
                 continue
+            if len(rec) < width:
+                rec += [""] * (width - len(rec))
+            yield pick(rec)
 
-            root_cause = (row.get("root_cause_summary_pred") or "").strip()
-            snippet = (row.get("pain_point_snippet_pred") or "").strip()
 
-            if not root_cause:
-                drop_reasons["empty_root_cause_summary"] += 1
-                continue
-            if not snippet:
-                drop_reasons["empty_pain_point_snippet"] += 1
-                continue
+def _write_course_tokens(painpoints: list[dict[str, str]], course_tokens_csv: Path) -> int:
+    """
+    Write per-course token totals for the painpoints about to be clustered.
+
+    Returns the largest single-course token total.
+    """
+    texts = [f"{p['root_cause_summary']}\n{p['pain_point_snippet']}" for p in painpoints]
+    token_counts = count_tokens_batch(texts)
+
+    totals: dict[str, list[int]] = {}
+    for p, n_tokens in zip(painpoints, token_counts):
+        entry = totals.setdefault(p["course_code"], [0, 0])
+        entry[0] += 1
+        entry[1] += n_tokens
+
+    course_tokens_csv.parent.mkdir(parents=True, exist_ok=True)
+    with course_tokens_csv.open("w", newline="", encoding="utf-8") as f_out:
+        writer = csv.writer(f_out)
+        writer.writerow(["course_code", "num_painpoints", "total_tokens"])
+        for course_code, (n_rows, n_tokens) in totals.items():
+            writer.writerow([course_code, n_rows, n_tokens])
+
+    return max((n_tokens for _, n_tokens in totals.values()), default=0)
+
+
+def prepare_painpoints(
+    input_csv: Path,
+    output_csv: Path,
+    course_tokens_csv: Path | None = None,
+) -> Dict[str, Any]:
+    output_csv.parent.mkdir(parents=True, exist_ok=True)
 
-            painpoints.append(
-                {
-                    "post_id": row["post_id"],
-                    "course_code": row["course_code"],
-                    "root_cause_summary": root_cause,
-                    "pain_point_snippet": snippet,
-                }
-            )
+    painpoints: list[dict[str, str]] = []
+    total = 0
+    drop_reasons: dict[str, int] = defaultdict(int)
+
+    for (
+        post_id,
+        course_code,
+        pred_label,
+        root_cause,
+        snippet,
+        parse_error,
+        schema_error,
+        used_fallback,
+        llm_failure,
+    ) in _iter_prediction_rows(input_csv):
+        total += 1
+
+        if pred_label != "y":
+            drop_reasons["not_painpoint"] += 1
+            continue
+
+        if (
+            _flag_is_true(parse_error)
+            or _flag_is_true(schema_error)
+            or _flag_is_true(used_fallback)
+            or _flag_is_true(llm_failure)
+        ):
+            drop_reasons["error_flagged"] += 1
+            continue
+
+        root_cause = (root_cause or "").strip()
+        snippet = (snippet or "").strip()
+
+        if not root_cause:
+            drop_reasons["empty_root_cause_summary"] += 1
+            continue
+        if not snippet:
+            drop_reasons["empty_pain_point_snippet"] += 1
+            continue
+
+        painpoints.append(
+            {
+                "post_id": post_id,
+                "course_code": course_code,
+                "root_cause_summary": root_cause,
+                "pain_point_snippet": snippet,
+            }
+        )
 
     course_post_ids: dict[str, set[str]] = defaultdict(set)
     for p in painpoints:
         course_post_ids[p["course_code"]].add(p["post_id"])
+    course_sizes = {code: len(ids) for code, ids in course_post_ids.items()}
 
-    painpoints.sort(
-        key=lambda r: (
-            -len(course_post_ids[r["course_code"]]),
-            r["course_code"],
-            r["post_id"],
-        )
-    )
+    def _sort_key(r: dict[str, str]) -> tuple[int, str, str]:
+        course_code = r["course_code"]
+        return -course_sizes[course_code], course_code, r["post_id"]
+
+    painpoints.sort(key=_sort_key)
 
     with output_csv.open("w", newline="", encoding="utf-8") as f_out:
         fieldnames = ["post_id", "course_code", "root_cause_summary", "pain_point_snippet"]
@@ -161,11 +258,14 @@ def prepare_painpoints(input_csv: Path, output_csv: Path) -> Dict[str, Any]:
         writer.writeheader()
         writer.writerows(painpoints)
 
-    return {
+    summary: Dict[str, Any] = {
         "total_rows_read": total,
         "rows_written": len(painpoints),
         "drop_reasons": dict(drop_reasons),
     }
+    if course_tokens_csv is not None:
+        summary["max_course_tokens"] = _write_course_tokens(painpoints, course_tokens_csv)
+    return summary
 
 
 def main() -> int:
@@ -185,15 +285,23 @@ def main() -> int:
         help="Explicit relative path to Stage 1 predictions_FULL.csv (overrides --input).",
     )
     p.add_argument("--output", type=Path, default=DEFAULT_OUTPUT_REL, help="Relative path to write painpoints CSV")
+    p.add_argument(
+        "--course-tokens",
+        type=Path,
+        default=DEFAULT_COURSE_TOKENS_REL,
+        help="Relative path to write per-course token totals CSV",
+    )
     p.add_argument("--manifest", type=Path, default=DEFAULT_MANIFEST_REL, help="Relative path to write manifest.json")
     args = p.parse_args()
 
     input_rel: Path = args.input_predictions if args.input_predictions is not None else args.input
     output_rel: Path = args.output
+    course_tokens_rel: Path = args.course_tokens
     manifest_rel: Path = args.manifest
 
     input_csv = _require_relpath(input_rel, "--input-predictions" if args.input_predictions is not None else "--input")
     output_csv = _require_relpath(output_rel, "--output")
+    course_tokens_csv = _require_relpath(course_tokens_rel, "--course-tokens")
     manifest_path = _require_relpath(manifest_rel, "--manifest")
 
     if not input_csv.exists():
@@ -202,26 +310,42 @@ def main() -> int:
     started_at = _utc_now()
     run_id = _make_run_id()
 
-    summary = prepare_painpoints(input_csv=input_csv, output_csv=output_csv)
+    summary = prepare_painpoints(
+        input_csv=input_csv,
+        output_csv=output_csv,
+        course_tokens_csv=course_tokens_csv,
+    )
+    parquet_path = _parquet_sibling(input_csv)
 
     manifest_path.parent.mkdir(parents=True, exist_ok=True)
 
+    inputs: Dict[str, Any] = {
+        "predictions_full_csv": {
+            "path": str(input_rel),
+            "bytes": input_csv.stat().st_size,
+        }
+    }
+    if parquet_path is not None:
+        inputs["predictions_full_parquet"] = {
+            "path": str(input_rel.with_suffix(".parquet")),
+            "bytes": parquet_path.stat().st_size,
+        }
+
     manifest = {
         "stage": "stage2",
         "run_id": run_id,
         "created_at_utc": started_at,
         "command": " ".join([os.path.basename(__file__)] + [a for a in os.sys.argv[1:]]),
-        "inputs": {
-            "predictions_full_csv": {
-                "path": str(input_rel),
-                "bytes": input_csv.stat().st_size,
-            }
-        },
+        "inputs": inputs,
         "outputs": {
             "painpoints_llm_friendly_csv": {
                 "path": str(output_rel),
                 "bytes": output_csv.stat().st_size,
-            }
+            },
+            "painpoints_course_tokens_csv": {
+                "path": str(course_tokens_rel),
+                "bytes": course_tokens_csv.stat().st_size,
+            },
         },
         "counts": summary,
         "git": _git_info(REPO_ROOT),
@@ -231,6 +355,7 @@ def main() -> int:
 
     print(f"Done. Kept {summary['rows_written']} painpoints out of {summary['total_rows_read']} rows read.")
     print(f"Written CSV: {output_rel}")
+    print(f"Written course tokens: {course_tokens_rel}")
     print(f"Written manifest: {manifest_rel}")
     return 0
 
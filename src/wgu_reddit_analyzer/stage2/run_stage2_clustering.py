@@ -10,27 +10,41 @@ Inputs:
     - artifacts/stage2/painpoints_llm_friendly.csv
     - data/course_list_with_college.csv
     - prompts/s2_cluster_batch.txt
+    - prompts/s2_cluster_pack.txt              (only with --pack-max-tokens)
 
 Outputs (per Stage-2 run):
     - artifacts/stage2/runs/<run_slug>_<timestamp>/:
         - clusters/<course_code>.json              (cluster JSON, Stage 2 schema)
         - painpoints_used_<course_code>.jsonl      (per-course inputs)
         - stage2_prompt.txt                        (copy of the prompt)
+        - stage2_pack_prompt.txt                   (copy of the pack prompt, if used)
         - manifest.json                            (Stage 2 run manifest)
 """
 
 from dataclasses import dataclass
 import argparse
 import csv
-import json
+import os
+import re
 import shutil
 import time
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Mapping
+from typing import Any, DefaultDict, Dict, Iterable, Iterator, List, Mapping, Tuple
 
+from wgu_reddit_analyzer.utils import json_utils
 from wgu_reddit_analyzer.utils.logging_utils import get_logger
-from wgu_reddit_analyzer.benchmark.model_client import generate
+from wgu_reddit_analyzer.utils.token_utils import count_tokens_batch
+from wgu_reddit_analyzer.benchmark.model_client import (
+    cache_lookup,
+    cache_store,
+    generate_batch,
+    generate_cached,
+)
+from wgu_reddit_analyzer.benchmark.model_registry import get_model_info
 from wgu_reddit_analyzer.stage2.validate_clusters import validate_clusters_dict
 from wgu_reddit_analyzer.stage2.stage2_types import (
     PainpointRecord,
@@ -41,15 +55,30 @@ from wgu_reddit_analyzer.core.schema_definitions import SCHEMA_VERSION
 
 logger = get_logger("stage2.run_clustering")
 
+DEFAULT_MAX_CONCURRENCY = 4
+DEFAULT_CACHE_DIR = "artifacts/stage2/llm_cache"
+DEFAULT_PACK_PROMPT = "prompts/s2_cluster_pack.txt"
+
+_TEMPLATE_PLACEHOLDER_RE = re.compile(r"\{(course_code|course_title)\}")
+# Markdown code fences (```json ... ```) around the model's answer.
+_FENCE_RE = re.compile(r"^```(?:json)?\s*|\s*```$", re.MULTILINE)
+
 
-@dataclass
+@dataclass(frozen=True)
 class Painpoint:
+    # Explicit __slots__ (dataclass(slots=True) needs Python 3.10+): no
+    # per-instance __dict__ across the whole painpoints corpus.
+    __slots__ = ("post_id", "course_code", "root_cause_summary", "pain_point_snippet")
+
     post_id: str
     course_code: str
     root_cause_summary: str
     pain_point_snippet: str
 
 
+_PAINPOINT_COLUMNS = ("post_id", "course_code", "root_cause_summary", "pain_point_snippet")
+
+
 def ensure_stage2_run_dir(run_slug: str, out_root: Path) -> Path:
     """
     Create a new Stage 2 run directory:
@@ -63,9 +92,10 @@ def ensure_stage2_run_dir(run_slug: str, out_root: Path) -> Path:
     return run_dir
 
 
-def load_painpoints(csv_path: Path) -> List[Painpoint]:
+def _iter_painpoints(csv_path: Path) -> Iterator[Painpoint]:
     """
-    Load preprocessed painpoints from CSV.
+    Yield preprocessed painpoints from CSV, skipping rows without a post_id
+    or without any summary/snippet text.
 
     Expected header:
         post_id,course_code,root_cause_summary,pain_point_snippet
@@ -73,25 +103,33 @@ def load_painpoints(csv_path: Path) -> List[Painpoint]:
     if not csv_path.is_file():
         raise FileNotFoundError(f"Painpoints CSV not found at {csv_path}")
 
-    items: List[Painpoint] = []
     with csv_path.open("r", encoding="utf-8", newline="") as f:
-        reader = csv.DictReader(f)
+        reader = csv.reader(f)
+        header = next(reader, [])
+        missing = [c for c in _PAINPOINT_COLUMNS if c not in header]
+        if missing:
+            raise RuntimeError(f"Painpoints CSV {csv_path} is missing columns: {', '.join(missing)}")
+        i_pid, i_course, i_summary, i_snippet = (header.index(c) for c in _PAINPOINT_COLUMNS)
+        width = len(header)
+
         for row in reader:
-            if not row.get("post_id"):
+            if len(row) < width:
+                row += [""] * (width - len(row))
+            post_id = row[i_pid]
+            if not post_id:
                 continue
-            summary = (row.get("root_cause_summary") or "").strip()
-            snippet = (row.get("pain_point_snippet") or "").strip()
+            summary = row[i_summary].strip()
+            snippet = row[i_snippet].strip()
             if not summary and not snippet:
                 continue
-            items.append(
-                Painpoint(
-                    post_id=row["post_id"],
-                    course_code=row["course_code"],
-                    root_cause_summary=summary,
-                    pain_point_snippet=snippet,
-                )
-            )
+            yield Painpoint(post_id, row[i_course], summary, snippet)
 
+
+def load_painpoints(csv_path: Path) -> List[Painpoint]:
+    """
+    Load preprocessed painpoints from CSV as a flat list.
+    """
+    items = list(_iter_painpoints(csv_path))
     if not items:
         raise RuntimeError(f"No painpoints loaded from {csv_path}")
 
@@ -99,6 +137,25 @@ def load_painpoints(csv_path: Path) -> List[Painpoint]:
     return items
 
 
+def load_and_group_painpoints(csv_path: Path) -> Dict[str, List[Painpoint]]:
+    """
+    Load preprocessed painpoints from CSV straight into per-course lists.
+
+    Single pass: the flat painpoints list is never materialized.
+    """
+    grouped = group_by_course(_iter_painpoints(csv_path))
+    if not grouped:
+        raise RuntimeError(f"No painpoints loaded from {csv_path}")
+
+    logger.info(
+        "Loaded %d painpoints across %d courses from %s",
+        sum(map(len, grouped.values())),
+        len(grouped),
+        csv_path,
+    )
+    return grouped
+
+
 def load_course_titles(meta_csv: Path) -> Dict[str, str]:
     """
     Load course titles from course metadata CSV.
@@ -130,10 +187,10 @@ def group_by_course(painpoints: Iterable[Painpoint]) -> Dict[str, List[Painpoint
     """
     Group painpoints by course_code.
     """
-    grouped: Dict[str, List[Painpoint]] = {}
+    grouped: DefaultDict[str, List[Painpoint]] = defaultdict(list)
     for p in painpoints:
-        grouped.setdefault(p.course_code, []).append(p)
-    return grouped
+        grouped[p.course_code].append(p)
+    return dict(grouped)
 
 
 def load_prompt_template(prompt_path: Path) -> str:
@@ -145,58 +202,146 @@ def load_prompt_template(prompt_path: Path) -> str:
     return prompt_path.read_text(encoding="utf-8")
 
 
+@lru_cache(maxsize=8)
+def _template_segments(template: str) -> Tuple[str, ...]:
+    """
+    Split a cluster prompt template once per run.
+
+    Even indices are literal text; odd indices are placeholder names
+    (course_code / course_title).
+    """
+    return tuple(_TEMPLATE_PLACEHOLDER_RE.split(template))
+
+
 def build_cluster_prompt(
     template: str,
     course_code: str,
     course_title: str,
     posts: List[Mapping[str, Any]],
+    posts_json: str | None = None,
 ) -> str:
     """
     Build the concrete LLM prompt for one course.
 
     The template contains {course_code} and {course_title} placeholders.
-    The posts list is appended as JSON.
+    The posts list is appended as JSON; pass posts_json to embed an
+    already-encoded block instead of re-encoding posts.
     """
-    prompt = (
-        template.replace("{course_code}", course_code)
-        .replace("{course_title}", course_title)
-    )
+    values = {"course_code": course_code, "course_title": course_title}
+    parts = [
+        values[seg] if i % 2 else seg
+        for i, seg in enumerate(_template_segments(template))
+    ]
+    parts.append("\n\nPOSTS:\n")
+    parts.append(posts_json if posts_json is not None else json_utils.dumps(posts, indent=True))
+    return "".join(parts)
+
+
+def build_pack_prompt(template: str, courses: List[Mapping[str, Any]]) -> str:
+    """
+    Build one LLM prompt covering several small courses.
+
+    Each entry of courses is {course_code, course_title, posts}; the list is
+    appended to the (placeholder-free) pack template as JSON.
+    """
+    return template + "\n\nCOURSES:\n" + json_utils.dumps(list(courses), indent=True)
+
+
+def split_pack_response(clusters_obj: Any, course_codes: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Split a multi-course cluster response into per-course cluster objects
+    ({"courses": [course]}) so each goes through the single-course path.
+
+    Raises ValueError if the response is malformed or a course is missing.
+    """
+    if not isinstance(clusters_obj, dict) or not isinstance(clusters_obj.get("courses"), list):
+        raise ValueError("Packed response must be an object with a 'courses' list")
+
+    by_code: Dict[str, Dict[str, Any]] = {}
+    for course in clusters_obj["courses"]:
+        if isinstance(course, dict) and isinstance(course.get("course_code"), str):
+            by_code.setdefault(course["course_code"], {"courses": [course]})
 
-    posts_json = json.dumps(posts, ensure_ascii=False, indent=2)
-    prompt += "\n\nPOSTS:\n"
-    prompt += posts_json
-    return prompt
+    missing = [cc for cc in course_codes if cc not in by_code]
+    if missing:
+        raise ValueError(f"Packed response is missing courses: {', '.join(missing)}")
+    return by_code
 
 
 def extract_json_from_response(raw_text: str) -> Any:
     """
-    Extract the outermost JSON object from the LLM response.
+    Extract the outermost JSON object from the LLM response, ignoring any
+    markdown code fences around it.
     """
-    raw_text = raw_text.strip()
-    if not raw_text:
+    text = _FENCE_RE.sub("", raw_text).strip()
+    if not text:
         raise ValueError("Empty LLM response")
 
-    start = raw_text.find("{")
-    end = raw_text.rfind("}")
+    start = text.find("{")
+    end = text.rfind("}")
     if start == -1 or end == -1 or end <= start:
         raise ValueError("Could not locate JSON object in LLM response")
 
-    json_str = raw_text[start : end + 1]
-    return json.loads(json_str)
+    return json_utils.loads(text[start : end + 1])
+
+
+def _encode_posts(posts: List[Mapping[str, Any]]) -> List[bytes]:
+    """Compact JSON encoding of each post, computed once per course."""
+    return [json_utils.dumps_bytes(obj) for obj in posts]
+
+
+def _compact_posts_block(encoded: List[bytes]) -> str:
+    """JSON array with one compact post object per line."""
+    return "[\n" + ",\n".join(b.decode("utf-8") for b in encoded) + "\n]"
+
+
+class _BackgroundWriter:
+    """
+    Small thread pool for run-artifact writes, so disk IO overlaps parsing,
+    validation and in-flight LLM calls. wait() drains the pool and re-raises
+    the first write error.
+    """
+
+    def __init__(self, max_workers: int = 2) -> None:
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="stage2-writer"
+        )
+        self._futures: List[Future] = []
+
+    def write_bytes(self, path: Path, data: bytes) -> None:
+        self._futures.append(self._executor.submit(path.write_bytes, data))
+
+    def wait(self) -> None:
+        self._executor.shutdown(wait=True)
+        for future in self._futures:
+            future.result()
+
+
+def _write_file(path: Path, data: bytes, writer: _BackgroundWriter | None) -> None:
+    if writer is None:
+        path.write_bytes(data)
+    else:
+        writer.write_bytes(path, data)
 
 
 def write_per_course_inputs(
-    out_dir: Path, course_code: str, posts: List[Mapping[str, Any]]
+    out_dir: Path,
+    course_code: str,
+    posts: List[Mapping[str, Any]],
+    encoded: List[bytes] | None = None,
+    writer: _BackgroundWriter | None = None,
 ) -> None:
     """
     Archive the exact painpoint rows used for Stage-2 clustering per course.
+
+    encoded, if given, is _encode_posts(posts) and is reused as-is. With a
+    writer the file is written in the background.
     """
+    if encoded is None:
+        encoded = _encode_posts(posts)
     out_dir.mkdir(parents=True, exist_ok=True)
     out_path = out_dir / f"painpoints_used_{course_code}.jsonl"
-    with out_path.open("w", encoding="utf-8") as f:
-        for obj in posts:
-            f.write(json.dumps(obj, ensure_ascii=False))
-            f.write("\n")
+    _write_file(out_path, b"".join(line + b"\n" for line in encoded), writer)
 
 
 def _convert_to_painpoint_records(
@@ -204,9 +349,12 @@ def _convert_to_painpoint_records(
 ) -> List[PainpointRecord]:
     """
     Convenience conversion to PainpointRecord models (for type safety elsewhere if needed).
+
+    Painpoints are already typed and cleaned by load_painpoints, so the
+    models are built with model_construct (no per-field re-validation).
     """
     return [
-        PainpointRecord(
+        PainpointRecord.model_construct(
             post_id=p.post_id,
             course_code=p.course_code,
             root_cause_summary=p.root_cause_summary,
@@ -216,6 +364,285 @@ def _convert_to_painpoint_records(
     ]
 
 
+def _resolve_max_concurrency(model_name: str, requested: int) -> int:
+    """
+    Clamp requested concurrency to >= 1.
+
+    Local Ollama backends only serve OLLAMA_NUM_PARALLEL requests at once,
+    so extra in-flight calls would just queue server-side.
+    """
+    workers = max(1, requested)
+    if get_model_info(model_name).provider == "ollama":
+        env_parallel = os.getenv("OLLAMA_NUM_PARALLEL", "").strip()
+        if env_parallel.isdigit() and int(env_parallel) > 0:
+            workers = min(workers, int(env_parallel))
+    return workers
+
+
+def _posts_payload(posts_for_course: List[Painpoint]) -> List[Dict[str, Any]]:
+    """Per-post input objects sent to the LLM for one course."""
+    return [
+        {
+            "post_id": p.post_id,
+            "root_cause_summary": p.root_cause_summary,
+            "pain_point_snippet": p.pain_point_snippet,
+        }
+        for p in posts_for_course
+    ]
+
+
+def _pack_small_courses(
+    jobs: List[Tuple[str, str, List[Painpoint]]],
+    model_name: str,
+    max_tokens: int,
+) -> List[List[Tuple[str, str, List[Painpoint]]]]:
+    """
+    Group course jobs into LLM calls.
+
+    Courses are taken smallest first and packed greedily while their
+    estimated post tokens stay within max_tokens; a course that does not
+    fit alone stays solo. max_tokens <= 0 disables packing.
+    """
+    if max_tokens <= 0:
+        return [[job] for job in jobs]
+
+    texts = [
+        "\n".join(p.root_cause_summary + "\n" + p.pain_point_snippet for p in posts)
+        for _, _, posts in jobs
+    ]
+    sized = sorted(zip(count_tokens_batch(texts, model=model_name), jobs), key=lambda t: t[0])
+
+    units: List[List[Tuple[str, str, List[Painpoint]]]] = []
+    current: List[Tuple[str, str, List[Painpoint]]] = []
+    current_tokens = 0
+    for tokens, job in sized:
+        if current and current_tokens + tokens > max_tokens:
+            units.append(current)
+            current, current_tokens = [], 0
+        current.append(job)
+        current_tokens += tokens
+    if current:
+        units.append(current)
+    return units
+
+
+def _prepare_course_prompt(
+    prompt_template: str,
+    course_code: str,
+    course_title: str,
+    posts_for_course: List[Painpoint],
+    run_dir: Path,
+    compact_posts: bool = False,
+    writer: _BackgroundWriter | None = None,
+) -> str:
+    """
+    Archive one course's inputs and return its rendered clustering prompt.
+
+    Each post is JSON-encoded once. With compact_posts the prompt embeds
+    those same bytes (one post per line) instead of re-encoding the list
+    with two-space indentation.
+    """
+    logger.info(
+        "Clustering course %s (%s) with %d painpoints",
+        course_code,
+        course_title,
+        len(posts_for_course),
+    )
+
+    # Build per-course input objects for the LLM.
+    posts_payload = _posts_payload(posts_for_course)
+
+    # Archive the exact inputs for this course.
+    encoded = _encode_posts(posts_payload)
+    write_per_course_inputs(run_dir, course_code, posts_payload, encoded=encoded, writer=writer)
+
+    return build_cluster_prompt(
+        template=prompt_template,
+        course_code=course_code,
+        course_title=course_title,
+        posts=posts_payload,
+        posts_json=_compact_posts_block(encoded) if compact_posts else None,
+    )
+
+
+def _finalize_course(
+    llm_result: Any,
+    course_code: str,
+    posts_for_course: List[Painpoint],
+    run_dir: Path,
+    clusters_dir: Path,
+    debug: bool = False,
+    writer: _BackgroundWriter | None = None,
+    pretty: bool = False,
+) -> Stage2CourseClusterSummary:
+    """
+    Parse and validate one course's LLM response, write its cluster JSON,
+    and return the manifest summary.
+    """
+    raw_text = llm_result.raw_text or ""
+    if debug:
+        logger.debug("LLM raw response for %s:\n%s", course_code, raw_text)
+
+    # Parse and validate JSON.
+    clusters_obj = extract_json_from_response(raw_text)
+    return _write_course_clusters(
+        clusters_obj,
+        llm_result,
+        course_code,
+        posts_for_course,
+        run_dir,
+        clusters_dir,
+        writer=writer,
+        pretty=pretty,
+    )
+
+
+def _write_course_clusters(
+    clusters_obj: Any,
+    llm_result: Any,
+    course_code: str,
+    posts_for_course: List[Painpoint],
+    run_dir: Path,
+    clusters_dir: Path,
+    cost_share: float = 1.0,
+    writer: _BackgroundWriter | None = None,
+    pretty: bool = False,
+) -> Stage2CourseClusterSummary:
+    """
+    Validate one course's parsed cluster object, write its cluster JSON, and
+    return the manifest summary.
+
+    cost_share is this course's fraction of the call cost when the call
+    covered several packed courses. The cluster JSON is compact unless
+    pretty is set.
+    """
+    valid_post_ids = {p.post_id for p in posts_for_course}
+    validate_clusters_dict(
+        clusters_obj,
+        course_code=course_code,
+        valid_post_ids=valid_post_ids,
+        expected_total_posts=len(posts_for_course),
+    )
+
+    # Write canonical cluster JSON.
+    out_path = clusters_dir / f"{course_code}.json"
+    _write_file(out_path, json_utils.dumps_bytes(clusters_obj, indent=pretty), writer)
+
+    # Per-course summary for manifest. Every field comes from validated
+    # clusters or an LlmCallResult, so skip Pydantic re-validation.
+    summary = Stage2CourseClusterSummary.model_construct(
+        course_code=course_code,
+        num_clusters=len(clusters_obj.get("courses", [])[0].get("clusters", [])),
+        num_painpoints=len(posts_for_course),
+        cluster_file=str(out_path.relative_to(run_dir)),
+        llm_model_name=llm_result.model_name,
+        llm_provider=llm_result.provider,
+        llm_total_cost_usd=(
+            None if llm_result.total_cost_usd is None else llm_result.total_cost_usd * cost_share
+        ),
+        llm_elapsed_sec=llm_result.elapsed_sec,
+    )
+
+    logger.info("Wrote clusters for %s to %s", course_code, out_path)
+    return summary
+
+
+def _cluster_one_course(
+    model_name: str,
+    prompt_template: str,
+    course_code: str,
+    course_title: str,
+    posts_for_course: List[Painpoint],
+    run_dir: Path,
+    clusters_dir: Path,
+    debug: bool = False,
+    cache_dir: Path | None = None,
+    compact_posts: bool = False,
+    writer: _BackgroundWriter | None = None,
+    pretty: bool = False,
+) -> Tuple[Stage2CourseClusterSummary, Any]:
+    """
+    Cluster one course: archive inputs, call the LLM, validate, write JSON.
+
+    Returns the manifest summary and the raw LlmCallResult.
+    """
+    llm_prompt = _prepare_course_prompt(
+        prompt_template, course_code, course_title, posts_for_course, run_dir, compact_posts, writer
+    )
+    llm_result = generate_cached(model_name, llm_prompt, cache_dir)
+    summary = _finalize_course(
+        llm_result,
+        course_code,
+        posts_for_course,
+        run_dir,
+        clusters_dir,
+        debug=debug,
+        writer=writer,
+        pretty=pretty,
+    )
+    # Cache only once the response has validated and its clusters are written.
+    if cache_dir is not None:
+        cache_store(llm_prompt, llm_result, cache_dir)
+    return summary, llm_result
+
+
+def _cluster_course_pack(
+    model_name: str,
+    pack_template: str,
+    pack: List[Tuple[str, str, List[Painpoint]]],
+    run_dir: Path,
+    clusters_dir: Path,
+    debug: bool = False,
+    cache_dir: Path | None = None,
+    writer: _BackgroundWriter | None = None,
+    pretty: bool = False,
+) -> Tuple[List[Stage2CourseClusterSummary], Any]:
+    """
+    Cluster several small courses with one LLM call.
+
+    Per-course inputs and cluster files are written exactly as in the
+    single-course path; the call cost is split across courses by their
+    share of the packed posts.
+    """
+    codes = [course_code for course_code, _, _ in pack]
+    logger.info("Clustering packed courses %s", ", ".join(codes))
+
+    courses_payload: List[Dict[str, Any]] = []
+    for course_code, course_title, posts_for_course in pack:
+        posts_payload = _posts_payload(posts_for_course)
+        write_per_course_inputs(run_dir, course_code, posts_payload, writer=writer)
+        courses_payload.append(
+            {"course_code": course_code, "course_title": course_title, "posts": posts_payload}
+        )
+
+    prompt = build_pack_prompt(pack_template, courses_payload)
+    llm_result = generate_cached(model_name, prompt, cache_dir)
+    raw_text = llm_result.raw_text or ""
+    if debug:
+        logger.debug("LLM raw response for pack %s:\n%s", codes, raw_text)
+
+    per_course_obj = split_pack_response(extract_json_from_response(raw_text), codes)
+    total_posts = sum(len(posts) for _, _, posts in pack)
+    summaries = [
+        _write_course_clusters(
+            per_course_obj[course_code],
+            llm_result,
+            course_code,
+            posts_for_course,
+            run_dir,
+            clusters_dir,
+            cost_share=len(posts_for_course) / total_posts,
+            writer=writer,
+            pretty=pretty,
+        )
+        for course_code, _, posts_for_course in pack
+    ]
+    # Cache only once every packed course has validated.
+    if cache_dir is not None:
+        cache_store(prompt, llm_result, cache_dir)
+    return summaries, llm_result
+
+
 def run_stage2_clustering(
     model_name: str,
     prompt_path: Path,
@@ -224,12 +651,28 @@ def run_stage2_clustering(
     out_root: Path,
     limit_courses: int | None = None,
     debug: bool = False,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    use_batch_api: bool = False,
+    cache_dir: Path | None = None,
+    compact_posts: bool = False,
+    pack_max_tokens: int = 0,
+    pack_prompt_path: Path | None = None,
+    pretty: bool = False,
 ) -> None:
     """
     Execute Stage-2 clustering across all courses present in painpoints CSV.
 
     Creates a run directory under:
         out_root / "runs" / <run_slug>_<timestamp>/
+
+    If cache_dir is set, responses for bit-identical (model, prompt) pairs
+    are reused from earlier runs at zero cost.
+
+    pack_max_tokens > 0 packs small courses into shared LLM calls (using
+    pack_prompt_path) while their estimated post tokens fit the budget.
+
+    Cluster JSON files are compact; pretty writes them with two-space
+    indentation for manual inspection.
     """
     logger.info(
         "Starting Stage 2 clustering: model=%s painpoints=%s",
@@ -238,10 +681,14 @@ def run_stage2_clustering(
     )
 
     # Load inputs
-    painpoints = load_painpoints(painpoints_csv)
+    grouped = load_and_group_painpoints(painpoints_csv)
     course_titles = load_course_titles(course_meta_csv)
-    grouped = group_by_course(painpoints)
     prompt_template = load_prompt_template(prompt_path)
+    if pack_max_tokens > 0 and use_batch_api:
+        logger.warning("--pack-max-tokens is ignored with --use-batch-api")
+        pack_max_tokens = 0
+    pack_prompt_path = pack_prompt_path or Path(DEFAULT_PACK_PROMPT)
+    pack_template = load_prompt_template(pack_prompt_path) if pack_max_tokens > 0 else ""
 
     # Run identity (Stage-1 style: model + mode + corpus tag)
     if limit_courses is None:
@@ -259,6 +706,8 @@ def run_stage2_clustering(
     # Archive the prompt for reproducibility.
     prompt_copy_path = run_dir / "stage2_prompt.txt"
     shutil.copy2(prompt_path, prompt_copy_path)
+    if pack_max_tokens > 0:
+        shutil.copy2(pack_prompt_path, run_dir / "stage2_pack_prompt.txt")
 
     # Optional: limit number of courses for smoke tests.
     course_codes = sorted(grouped.keys())
@@ -270,84 +719,138 @@ def run_stage2_clustering(
     total_cost = 0.0
     total_elapsed = 0.0
     num_cluster_calls = 0
-    total_painpoints = len(painpoints)
+    num_cache_hits = 0
+    total_painpoints = sum(map(len, grouped.values()))
     per_course_summary: Dict[str, Stage2CourseClusterSummary] = {}
 
-    for course_code in course_codes:
-        posts_for_course = grouped[course_code]
-        if not posts_for_course:
-            continue
-
-        course_title = course_titles.get(course_code, course_code)
-
-        logger.info(
-            "Clustering course %s (%s) with %d painpoints",
-            course_code,
-            course_title,
-            len(posts_for_course),
-        )
+    # Per-course calls are independent; run them on a bounded thread pool and
+    # collect results in course order so the manifest stays deterministic.
+    jobs = [
+        (course_code, course_titles.get(course_code, course_code), grouped[course_code])
+        for course_code in course_codes
+        if grouped[course_code]
+    ]
 
-        # Build per-course input objects for the LLM.
-        posts_payload: List[Dict[str, Any]] = [
-            {
-                "post_id": p.post_id,
-                "root_cause_summary": p.root_cause_summary,
-                "pain_point_snippet": p.pain_point_snippet,
+    # Artifact writes go to a background pool; all of them land before the
+    # manifest is written.
+    writer = _BackgroundWriter()
+    try:
+        if use_batch_api:
+            # One OpenAI batch job for all courses: half price, no per-call overhead.
+            prompts = {
+                course_code: _prepare_course_prompt(
+                    prompt_template,
+                    course_code,
+                    course_title,
+                    posts_for_course,
+                    run_dir,
+                    compact_posts,
+                    writer,
+                )
+                for course_code, course_title, posts_for_course in jobs
             }
-            for p in posts_for_course
-        ]
-
-        # Archive the exact inputs for this course.
-        write_per_course_inputs(run_dir, course_code, posts_payload)
-
-        # Build prompt and call LLM.
-        llm_prompt = build_cluster_prompt(
-            template=prompt_template,
-            course_code=course_code,
-            course_title=course_title,
-            posts=posts_payload,
-        )
-
-        llm_result = generate(model_name=model_name, prompt=llm_prompt)  # type: ignore[arg-type]
-        num_cluster_calls += 1
-
-        raw_text = llm_result.raw_text or ""
-        if debug:
-            logger.debug("LLM raw response for %s:\n%s", course_code, raw_text)
-
-        # Aggregate cost and time
-        total_cost += llm_result.total_cost_usd or 0.0
-        total_elapsed += llm_result.elapsed_sec or 0.0
-
-        # Parse and validate JSON.
-        clusters_obj = extract_json_from_response(raw_text)
-
-        valid_post_ids = {p.post_id for p in posts_for_course}
-        validate_clusters_dict(
-            clusters_obj,
-            course_code=course_code,
-            valid_post_ids=valid_post_ids,
-            expected_total_posts=len(posts_for_course),
-        )
-
-        # Write canonical cluster JSON.
-        out_path = clusters_dir / f"{course_code}.json"
-        with out_path.open("w", encoding="utf-8") as f:
-            json.dump(clusters_obj, f, ensure_ascii=False, indent=2)
-
-        # Per-course summary for manifest
-        per_course_summary[course_code] = Stage2CourseClusterSummary(
-            course_code=course_code,
-            num_clusters=len(clusters_obj.get("courses", [])[0].get("clusters", [])),
-            num_painpoints=len(posts_for_course),
-            cluster_file=str(out_path.relative_to(run_dir)),
-            llm_model_name=llm_result.model_name,
-            llm_provider=llm_result.provider,
-            llm_total_cost_usd=llm_result.total_cost_usd,
-            llm_elapsed_sec=llm_result.elapsed_sec,
-        )
+            batch_results: Dict[str, Any] = {}
+            if cache_dir is not None:
+                for course_code, prompt in prompts.items():
+                    cached = cache_lookup(model_name, prompt, cache_dir)
+                    if cached is not None:
+                        batch_results[course_code] = cached
+            misses = {cc: p for cc, p in prompts.items() if cc not in batch_results}
+            if misses:
+                fresh = generate_batch(model_name, misses)
+                # Every fresh result shares the batch wallclock; count it once.
+                total_elapsed = next(iter(fresh.values())).elapsed_sec
+                batch_results.update(fresh)
+
+            # The whole batch is already paid for: write and cache every course
+            # that validates, then report all failures together.
+            failures: List[str] = []
+            for course_code, _, posts_for_course in jobs:
+                llm_result = batch_results[course_code]
+                num_cluster_calls += 1
+                num_cache_hits += int(llm_result.cache_hit)
+                total_cost += llm_result.total_cost_usd or 0.0
+                if llm_result.llm_failure:
+                    failures.append(f"{course_code}: {llm_result.error_message or 'LLM call failed'}")
+                    continue
+                try:
+                    per_course_summary[course_code] = _finalize_course(
+                        llm_result,
+                        course_code,
+                        posts_for_course,
+                        run_dir,
+                        clusters_dir,
+                        debug=debug,
+                        writer=writer,
+                        pretty=pretty,
+                    )
+                except Exception as e:  # noqa: BLE001
+                    failures.append(f"{course_code}: {type(e).__name__}: {e}")
+                    continue
+                # Cache only once the response has validated and been written.
+                if cache_dir is not None:
+                    cache_store(prompts[course_code], llm_result, cache_dir)
+            if failures:
+                raise RuntimeError(
+                    f"{len(failures)} of {len(jobs)} batch courses failed:\n" + "\n".join(failures)
+                )
+        else:
+            workers = _resolve_max_concurrency(model_name, max_concurrency)
+            units = _pack_small_courses(jobs, model_name, pack_max_tokens)
+            logger.info(
+                "Clustering %d courses in %d calls with max_concurrency=%d",
+                len(jobs),
+                len(units),
+                workers,
+            )
 
-        logger.info("Wrote clusters for %s to %s", course_code, out_path)
+            def _run_unit(
+                unit: List[Tuple[str, str, List[Painpoint]]],
+            ) -> Tuple[List[Stage2CourseClusterSummary], Any]:
+                if len(unit) > 1:
+                    return _cluster_course_pack(
+                        model_name=model_name,
+                        pack_template=pack_template,
+                        pack=unit,
+                        run_dir=run_dir,
+                        clusters_dir=clusters_dir,
+                        debug=debug,
+                        cache_dir=cache_dir,
+                        writer=writer,
+                        pretty=pretty,
+                    )
+                course_code, course_title, posts_for_course = unit[0]
+                summary, llm_result = _cluster_one_course(
+                    model_name=model_name,
+                    prompt_template=prompt_template,
+                    course_code=course_code,
+                    course_title=course_title,
+                    posts_for_course=posts_for_course,
+                    run_dir=run_dir,
+                    clusters_dir=clusters_dir,
+                    debug=debug,
+                    cache_dir=cache_dir,
+                    compact_posts=compact_posts,
+                    writer=writer,
+                    pretty=pretty,
+                )
+                return [summary], llm_result
+
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for summaries, llm_result in executor.map(_run_unit, units):
+                    num_cluster_calls += 1
+                    num_cache_hits += int(llm_result.cache_hit)
+                    total_cost += llm_result.total_cost_usd or 0.0
+                    total_elapsed += llm_result.elapsed_sec or 0.0
+                    for summary in summaries:
+                        per_course_summary[summary.course_code] = summary
+    finally:
+        writer.wait()
+
+    # Packing reorders calls; keep the manifest in course order.
+    per_course_summary = {
+        cc: per_course_summary[cc] for cc in course_codes if cc in per_course_summary
+    }
 
     finished_at = time.time()
     wallclock = finished_at - started_at
@@ -364,6 +867,7 @@ def run_stage2_clustering(
         num_courses=len(course_codes),
         total_painpoints=total_painpoints,
         num_cluster_calls=num_cluster_calls,
+        num_cache_hits=num_cache_hits,
         started_at_epoch=started_at,
         finished_at_epoch=finished_at,
         wallclock_sec=wallclock,
@@ -373,8 +877,9 @@ def run_stage2_clustering(
     )
 
     manifest_path = run_dir / "manifest.json"
-    manifest_json = manifest.model_dump_json(indent=2)
-    manifest_path.write_text(manifest_json, encoding="utf-8")
+    manifest_bytes = json_utils.dumps_bytes(manifest.model_dump(mode="json"), indent=True)
+    manifest_path.write_bytes(manifest_bytes)
+    manifest_json = manifest_bytes.decode("utf-8")
 
     logger.info("Stage 2 clustering complete. Manifest: %s", manifest_path)
     print(manifest_json)
@@ -415,6 +920,48 @@ def parse_args() -> argparse.Namespace:
         default=None,
         help="Optional limit on number of courses to cluster (for smoke tests).",
     )
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=DEFAULT_MAX_CONCURRENCY,
+        help="Maximum concurrent per-course LLM calls (capped by OLLAMA_NUM_PARALLEL for Ollama models).",
+    )
+    parser.add_argument(
+        "--use-batch-api",
+        action="store_true",
+        help="Submit all course prompts as one OpenAI Batch API job (half price, completes within 24h).",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=DEFAULT_CACHE_DIR,
+        help="Directory for the (model, prompt) response cache reused across runs.",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always call the model; do not read or write the response cache.",
+    )
+    parser.add_argument(
+        "--compact-posts",
+        action="store_true",
+        help="Embed posts in the prompt one compact JSON object per line (changes prompt text; default keeps indent=2).",
+    )
+    parser.add_argument(
+        "--pack-max-tokens",
+        type=int,
+        default=0,
+        help="Pack small courses into shared LLM calls while their estimated post tokens fit this budget (0 = one call per course).",
+    )
+    parser.add_argument(
+        "--pack-prompt",
+        default=DEFAULT_PACK_PROMPT,
+        help="Prompt template for packed multi-course calls.",
+    )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Write per-course cluster JSON with two-space indentation (default: compact).",
+    )
     parser.add_argument(
         "--debug",
         action="store_true",
@@ -433,6 +980,13 @@ def main() -> None:
         out_root=Path(args.out_root),
         limit_courses=args.limit_courses,
         debug=args.debug,
+        max_concurrency=args.max_concurrency,
+        use_batch_api=args.use_batch_api,
+        cache_dir=None if args.no_cache else Path(args.cache_dir),
+        compact_posts=args.compact_posts,
+        pack_max_tokens=args.pack_max_tokens,
+        pack_prompt_path=Path(args.pack_prompt),
+        pretty=args.pretty,
     )
 
 
@@ -137,6 +137,7 @@ class Stage2RunManifest(BaseModel):
     num_courses: int
     total_painpoints: int
     num_cluster_calls: int
+    num_cache_hits: int = 0
 
     # Timing and cost
     started_at_epoch: float
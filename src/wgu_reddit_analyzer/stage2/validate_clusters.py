@@ -14,10 +14,11 @@ In that case:
 
 import argparse
 import csv
-import json
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, Iterable, Set
+from typing import Any, Dict, Iterable, List, Set, Tuple
 
+from wgu_reddit_analyzer.utils import json_utils
 from wgu_reddit_analyzer.utils.logging_utils import get_logger
 
 import logging
@@ -29,6 +30,9 @@ except Exception:
     logging.basicConfig(level=logging.INFO)
     logger = logging.getLogger("stage2.validate_clusters")
 
+_NO_BAD_ID = object()
+
+
 def _ensure(condition: bool, message: str) -> None:
     if not condition:
         raise ValueError(message)
@@ -54,7 +58,7 @@ def validate_clusters_dict(
         - expected_total_posts != unique post_ids
         - total_posts != unique post_ids  → we normalize total_posts
     """
-    valid_ids: Set[str] = set(valid_post_ids)
+    valid_ids: frozenset[str] = frozenset(valid_post_ids)
 
     _ensure(isinstance(obj, dict), "Top-level JSON must be an object")
 
@@ -77,13 +81,14 @@ def validate_clusters_dict(
     _ensure(isinstance(total_posts, int), "'total_posts' must be an integer")
 
     seen_post_ids: Set[str] = set()
+    seen_update = seen_post_ids.update
+    prefix = f"{course_code}_"
 
     for cluster in clusters:
         _ensure(isinstance(cluster, dict), "Cluster entry must be an object")
 
         cluster_id = cluster.get("cluster_id")
         _ensure(isinstance(cluster_id, str), "cluster_id must be a string")
-        prefix = f"{course_code}_"
         _ensure(
             cluster_id.startswith(prefix),
             f"cluster_id '{cluster_id}' must start with '{prefix}'",
@@ -109,13 +114,15 @@ def validate_clusters_dict(
             f"Cluster {cluster_id} num_posts={num_posts} but len(post_ids)={len(post_ids)}",
         )
 
-        for pid in post_ids:
-            _ensure(isinstance(pid, str), "post_ids entries must be strings")
-            _ensure(
-                pid in valid_ids,
-                f"Cluster {cluster_id} references unknown post_id '{pid}'",
-            )
-            seen_post_ids.add(pid)
+        # One scan for the first offending entry instead of two _ensure calls per post_id
+        bad = next(
+            (pid for pid in post_ids if type(pid) is not str or pid not in valid_ids),
+            _NO_BAD_ID,
+        )
+        if bad is not _NO_BAD_ID:
+            _ensure(isinstance(bad, str), "post_ids entries must be strings")
+            raise ValueError(f"Cluster {cluster_id} references unknown post_id '{bad}'")
+        seen_update(post_ids)
 
     # Unique post count across all clusters
     unique_post_count = len(seen_post_ids)
@@ -150,28 +157,75 @@ def validate_clusters_dict(
     )
 
 
+def _validate_one(json_path: Path, valid_ids: Set[str]) -> str | None:
+    """
+    Load and validate one cluster file. Returns an error message, or None if valid.
+
+    Top-level so it can run in a worker process.
+    """
+    try:
+        obj = json_utils.loads(json_path.read_bytes())
+        validate_clusters_dict(
+            obj,
+            course_code=json_path.stem,
+            valid_post_ids=valid_ids,
+            expected_total_posts=len(valid_ids),
+        )
+    except Exception as e:  # noqa: BLE001
+        return f"{json_path.name}: {type(e).__name__}: {e}"
+    return None
+
+
+def _load_course_post_ids_polars(painpoints_csv: Path) -> Dict[str, Set[str]] | None:
+    """
+    Build course_code -> {post_id} with a polars group-by when it is installed.
+
+    All columns are read as strings and empty cells as "", matching the
+    csv.DictReader path. Returns None if polars is unavailable so the caller
+    can fall back.
+    """
+    try:
+        import polars as pl
+    except ImportError:
+        return None
+
+    df = pl.read_csv(
+        painpoints_csv,
+        columns=["course_code", "post_id"],
+        infer_schema_length=0,
+    ).fill_null("")
+    grouped = df.group_by("course_code").agg(pl.col("post_id").unique())
+    return {code: set(pids) for code, pids in grouped.iter_rows()}
+
+
 def validate_clusters_dir(
     clusters_dir: Path,
     painpoints_csv: Path,
+    max_workers: int | None = None,
 ) -> None:
     """
     Validate all cluster JSON files in a directory against the painpoints CSV.
+
+    Files are independent, so they are validated in a process pool. Every
+    file is checked; all failures are reported together in one ValueError.
     """
     if not clusters_dir.is_dir():
         raise FileNotFoundError(f"Clusters directory not found at {clusters_dir}")
     if not painpoints_csv.is_file():
         raise FileNotFoundError(f"Painpoints CSV not found at {painpoints_csv}")
 
-    course_to_ids: Dict[str, Set[str]] = {}
-
-    with painpoints_csv.open("r", encoding="utf-8", newline="") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            code = row["course_code"]
-            pid = row["post_id"]
-            course_to_ids.setdefault(code, set()).add(pid)
-
-    for json_path in clusters_dir.glob("*.json"):
+    course_to_ids = _load_course_post_ids_polars(painpoints_csv)
+    if course_to_ids is None:
+        course_to_ids = {}
+        with painpoints_csv.open("r", encoding="utf-8", newline="") as f:
+            reader = csv.DictReader(f)
+            for row in reader:
+                code = row["course_code"]
+                pid = row["post_id"]
+                course_to_ids.setdefault(code, set()).add(pid)
+
+    tasks: List[Tuple[Path, Set[str]]] = []
+    for json_path in sorted(clusters_dir.glob("*.json")):
         course_code = json_path.stem
         valid_ids = course_to_ids.get(course_code, set())
         if not valid_ids:
@@ -181,13 +235,19 @@ def validate_clusters_dir(
                 json_path,
             )
             continue
+        tasks.append((json_path, valid_ids))
 
-        obj = json.loads(json_path.read_text(encoding="utf-8"))
-        validate_clusters_dict(
-            obj,
-            course_code=course_code,
-            valid_post_ids=valid_ids,
-            expected_total_posts=len(valid_ids),
+    if not tasks:
+        return
+
+    paths = [t[0] for t in tasks]
+    id_sets = [t[1] for t in tasks]
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        errors = [e for e in executor.map(_validate_one, paths, id_sets) if e]
+
+    if errors:
+        raise ValueError(
+            f"{len(errors)} of {len(tasks)} cluster files failed validation:\n" + "\n".join(errors)
         )
 
 
@@ -2,18 +2,56 @@
 
 import argparse
 import csv
-import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from wgu_reddit_analyzer.utils import json_utils
+
+
+MAX_READ_WORKERS = 32
+WRITE_BUFFER_BYTES = 1 << 20
+FIELDNAMES = ["cluster_id", "issue_summary", "course_code", "course_title", "num_posts"]
+
+
+def _load_cluster_file(json_path: Path):
+    return json_utils.loads(json_path.read_bytes())
+
+
+def _write_csv_polars(rows, out_path: Path) -> bool:
+    """
+    Sort and write rows with polars when it is installed.
+
+    Matches the csv.DictWriter output (same ordering, CRLF line endings).
+    Returns False if polars is unavailable so the caller can fall back.
+    """
+    try:
+        import polars as pl
+    except ImportError:
+        return False
+
+    schema = {
+        "cluster_id": pl.Utf8,
+        "issue_summary": pl.Utf8,
+        "course_code": pl.Utf8,
+        "course_title": pl.Utf8,
+        "num_posts": pl.Int64,
+    }
+    df = pl.DataFrame(rows, schema=schema)
+    sort_keys = [pl.col("course_code").fill_null(""), pl.col("cluster_id").fill_null("")]
+    df.sort(sort_keys, maintain_order=True).write_csv(out_path, line_terminator="\r\n")
+    return True
+
 
 def preprocess_clusters(stage2_run_dir: Path, out_path: Path) -> None:
     clusters_dir = stage2_run_dir / "clusters"
     rows = []
 
-    for json_path in sorted(clusters_dir.glob("*.json")):
-        with json_path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
+    # Overlap file reads on a thread pool; map() keeps path order for determinism.
+    paths = sorted(clusters_dir.glob("*.json"))
+    with ThreadPoolExecutor(max_workers=max(1, min(MAX_READ_WORKERS, len(paths)))) as executor:
+        datas = list(executor.map(_load_cluster_file, paths))
 
+    for data in datas:
         for course_obj in data.get("courses", []):
             course_code = course_obj.get("course_code")
             course_title = course_obj.get("course_title")
@@ -26,14 +64,16 @@ def preprocess_clusters(stage2_run_dir: Path, out_path: Path) -> None:
                     "num_posts": cluster.get("num_posts"),
                 })
 
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+
+    if _write_csv_polars(rows, out_path):
+        return
+
     # optional stable ordering
     rows.sort(key=lambda r: (r["course_code"] or "", r["cluster_id"] or ""))
 
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    fieldnames = ["cluster_id", "issue_summary", "course_code", "course_title", "num_posts"]
-
-    with out_path.open("w", encoding="utf-8", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
+    with out_path.open("w", encoding="utf-8", newline="", buffering=WRITE_BUFFER_BYTES) as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDNAMES)
         writer.writeheader()
         writer.writerows(rows)
 
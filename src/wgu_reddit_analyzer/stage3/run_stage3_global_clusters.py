@@ -22,20 +22,28 @@ Behavior:
 """
 
 import argparse
+import os
 from pathlib import Path
 from typing import Optional
 
 from wgu_reddit_analyzer.stage3.validate_global_clusters import validate_global_clusters
 
+_REQUIRED_FILES = ("global_clusters.json", "cluster_global_index.csv")
+
 
 def _latest_run_with_required_files(runs_dir: Path) -> Path:
     if not runs_dir.exists():
         raise FileNotFoundError(f"Stage 3 runs dir not found: {runs_dir}")
 
+    # One scandir pass; DirEntry.is_dir uses the cached d_type, so only the
+    # candidates actually checked cost a stat per required file.
+    with os.scandir(runs_dir) as it:
+        run_dirs = [e for e in it if e.is_dir()]
+
     # newest first
-    for d in sorted([p for p in runs_dir.iterdir() if p.is_dir()], key=lambda p: p.name, reverse=True):
-        if (d / "global_clusters.json").is_file() and (d / "cluster_global_index.csv").is_file():
-            return d
+    for entry in sorted(run_dirs, key=lambda e: e.name, reverse=True):
+        if all(os.path.isfile(os.path.join(entry.path, name)) for name in _REQUIRED_FILES):
+            return Path(entry.path)
 
     raise FileNotFoundError(f"No Stage 3 run dir contains global_clusters.json and cluster_global_index.csv under {runs_dir}")
 
@@ -6,12 +6,13 @@ Stage 3 data models.
 Defines:
     - LlmGlobalCluster: one global issue group from the Stage 3 LLM.
     - LlmGlobalOutput: raw per-batch LLM output schema.
+    - GlobalClusterRecord: one entry of a written global_clusters.json.
     - Stage3RunManifest: run-level manifest for Stage 3 global clustering.
 """
 
-from typing import List
+from typing import Annotated, List
 
-from pydantic import BaseModel, Field
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field, StrictStr
 
 from wgu_reddit_analyzer.core.schema_definitions import SCHEMA_VERSION
 
@@ -53,6 +54,37 @@ class LlmGlobalOutput(BaseModel):
     unassigned_clusters: List[str]
 
 
+def _non_blank(value: str) -> str:
+    if not value.strip():
+        raise ValueError("must be a non-empty string")
+    return value
+
+
+NonEmptyStr = Annotated[StrictStr, AfterValidator(_non_blank)]
+NonNegativeInt = Annotated[int, Field(strict=True, ge=0)]
+
+
+class GlobalClusterRecord(LlmGlobalCluster):
+    """
+    One entry of global_clusters.json: an LLM global cluster plus the id
+    and counts Stage 3 adds when writing it out.
+
+    Values are kept exactly as written (no whitespace stripping) so ids
+    match cluster_global_index.csv verbatim.
+    """
+
+    model_config = ConfigDict(str_strip_whitespace=False, extra="ignore")
+
+    global_cluster_id: NonEmptyStr
+    provisional_label: NonEmptyStr
+    normalized_issue_label: NonEmptyStr
+    short_description: NonEmptyStr
+    member_cluster_ids: List[NonEmptyStr]
+    total_num_posts: NonNegativeInt
+    num_clusters: NonNegativeInt
+    num_courses: NonNegativeInt
+
+
 class Stage3RunManifest(BaseModel):
     """
     Run-level manifest for Stage 3 global clustering.
@@ -11,39 +11,156 @@ Validates that:
 """
 
 import argparse
-import csv
-import json
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Set
+from typing import Any, BinaryIO, Dict, Iterator, List, Set, Tuple
 
+import numpy as np
+import pandas as pd
+from pydantic import TypeAdapter, ValidationError
+
+try:
+    import ijson  # type: ignore
+except ImportError:
+    ijson = None
+
+from wgu_reddit_analyzer.stage3.stage3_types import GlobalClusterRecord, NonEmptyStr
+from wgu_reddit_analyzer.utils import json_utils
 from wgu_reddit_analyzer.utils.logging_utils import get_logger
 
 logger = get_logger("stage3.validate_global_clusters")
 
+_UNASSIGNED_ADAPTER = TypeAdapter(List[NonEmptyStr])
+
 
 def _ensure(condition: bool, message: str) -> None:
     if not condition:
         raise ValueError(message)
 
 
-def _load_cluster_global_index(path: Path) -> Dict[str, Dict[str, Any]]:
+def _describe_validation_error(label: str, exc: ValidationError) -> str:
+    """One '<label>: <field>: <problem>' line per pydantic error."""
+    return "\n".join(
+        f"{label}: {'.'.join(map(str, err['loc'])) or 'entry'}: {err['msg']}"
+        for err in exc.errors()
+    )
+
+
+@dataclass(frozen=True)
+class _ClusterIndex:
+    """
+    cluster_global_index.csv as parallel arrays, one entry per cluster_id,
+    sorted by cluster_id so ids can be resolved with np.searchsorted.
+    """
+
+    cluster_ids: np.ndarray
+    num_posts: np.ndarray
+    course_codes: np.ndarray
+
+    def rows_for(self, ids: np.ndarray) -> np.ndarray:
+        """Return the row of each id in ids, or -1 where the id is unknown."""
+        pos = np.searchsorted(self.cluster_ids, ids)
+        found = pos < len(self.cluster_ids)
+        found[found] = self.cluster_ids[pos[found]] == ids[found]
+        return np.where(found, pos, -1)
+
+
+def _load_cluster_global_index(path: Path) -> _ClusterIndex:
     if not path.is_file():
         raise FileNotFoundError(f"cluster_global_index.csv not found at {path}")
 
-    meta: Dict[str, Dict[str, Any]] = {}
-    with path.open("r", encoding="utf-8", newline="") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            cid = row.get("cluster_id")
-            if not cid:
-                continue
-            meta[cid] = row
+    df = pd.read_csv(
+        path,
+        usecols=["cluster_id", "num_posts", "course_code"],
+        dtype=str,
+        keep_default_na=False,
+        encoding="utf-8",
+    )
+    df = df[df["cluster_id"] != ""]
+    # Later rows win for a repeated cluster_id.
+    df = df.drop_duplicates("cluster_id", keep="last").sort_values("cluster_id")
 
-    if not meta:
+    if df.empty:
         raise RuntimeError(f"No rows loaded from {path}")
 
-    logger.info("Loaded %d cluster rows from %s", len(meta), path)
-    return meta
+    cluster_ids = df["cluster_id"].to_numpy(dtype=str)
+    index = _ClusterIndex(
+        cluster_ids=cluster_ids,
+        # Unparseable counts contribute 0 posts.
+        num_posts=pd.to_numeric(df["num_posts"], errors="coerce").fillna(0).to_numpy(dtype=np.int64),
+        course_codes=df["course_code"].str.strip().to_numpy(dtype=object),
+    )
+
+    logger.info("Loaded %d cluster rows from %s", len(cluster_ids), path)
+    return index
+
+
+_ARRAY_FIELDS = ("global_clusters", "unassigned_clusters")
+
+
+def _stream_array_items(f: BinaryIO) -> Iterator[Tuple[str, Any]]:
+    """
+    Yield (field, item) for the items of the top-level global_clusters and
+    unassigned_clusters arrays, building one item at a time with ijson.
+
+    Raises ValueError if the document is not an object or either field is
+    missing or not a list.
+    """
+    events = ijson.parse(f, use_float=True)
+    _, first_event, _ = next(events, ("", None, None))
+    _ensure(first_event == "start_map", "Top-level global_clusters.json must be an object")
+
+    is_list: Dict[str, bool] = {}
+    item_prefixes = {f"{field}.item": field for field in _ARRAY_FIELDS}
+    builder = None
+    depth = 0
+    field = ""
+
+    for prefix, event, value in events:
+        if builder is not None:
+            builder.event(event, value)
+            if event in ("start_map", "start_array"):
+                depth += 1
+            elif event in ("end_map", "end_array"):
+                depth -= 1
+                if depth == 0:
+                    yield field, builder.value
+                    builder = None
+        elif prefix in item_prefixes:
+            field = item_prefixes[prefix]
+            if event in ("start_map", "start_array"):
+                builder = ijson.ObjectBuilder()
+                builder.event(event, value)
+                depth = 1
+            else:
+                yield field, value
+        elif prefix in _ARRAY_FIELDS and event != "end_array":
+            is_list[prefix] = event == "start_array"
+
+    for name in _ARRAY_FIELDS:
+        _ensure(is_list.get(name, False), f"Field '{name}' must be a list")
+
+
+def _iter_global_json(path: Path) -> Iterator[Tuple[str, Any]]:
+    """
+    Yield (field, item) for every entry of global_clusters, then of
+    unassigned_clusters.
+
+    Streams with ijson when it is installed, so only one global cluster is
+    materialized at a time; otherwise parses the whole file via json_utils.
+    """
+    if ijson is not None:
+        with path.open("rb") as f:
+            yield from _stream_array_items(f)
+        return
+
+    obj = json_utils.loads(path.read_bytes())
+    _ensure(isinstance(obj, dict), "Top-level global_clusters.json must be an object")
+    for name in _ARRAY_FIELDS:
+        _ensure(isinstance(obj.get(name), list), f"Field '{name}' must be a list")
+    for name in _ARRAY_FIELDS:
+        for item in obj[name]:
+            yield name, item
 
 
 def validate_global_clusters(run_dir: Path) -> None:
@@ -60,165 +177,159 @@ def validate_global_clusters(run_dir: Path) -> None:
             f"cluster_global_index.csv not found at {index_csv_path}"
         )
 
-    cluster_meta = _load_cluster_global_index(index_csv_path)
-    all_cluster_ids: Set[str] = set(cluster_meta.keys())
-
-    obj = json.loads(global_json_path.read_text(encoding="utf-8"))
-    _ensure(isinstance(obj, dict), "Top-level global_clusters.json must be an object")
-
-    global_clusters = obj.get("global_clusters")
-    _ensure(
-        isinstance(global_clusters, list),
-        "Field 'global_clusters' must be a list",
-    )
-
-    unassigned_clusters = obj.get("unassigned_clusters")
-    _ensure(
-        isinstance(unassigned_clusters, list),
-        "Field 'unassigned_clusters' must be a list",
-    )
+    cluster_index = _load_cluster_global_index(index_csv_path)
+    num_posts_arr = cluster_index.num_posts
+    course_arr = cluster_index.course_codes
 
-    assigned_ids: Set[str] = set()
     global_ids: Set[str] = set()
-    last_total_posts: int | None = None
-
-    for gc in global_clusters:
-        _ensure(isinstance(gc, dict), "Each entry in global_clusters must be an object")
-
-        gid = gc.get("global_cluster_id")
-        _ensure(
-            isinstance(gid, str) and gid.strip(),
-            "global_cluster_id must be a non-empty string",
-        )
-        _ensure(gid not in global_ids, f"Duplicate global_cluster_id '{gid}'")
+    # Every violation found is collected and raised together at the end.
+    errors: List[str] = []
+
+    # Per global cluster: declared counts plus its slice of one flat member
+    # list, so the cross-checks below run as array reductions.
+    gids: List[str] = []
+    declared_clusters: List[int] = []
+    declared_posts: List[int] = []
+    declared_courses: List[int] = []
+    group_lengths: List[int] = []
+    flat_members: List[str] = []
+    unassigned_clusters: List[Any] = []
+
+    # Each entry's schema is checked by GlobalClusterRecord in one pydantic
+    # pass. Only the scalars and member ids above are kept per global
+    # cluster, so each parsed entry can be dropped as soon as it is checked.
+    # Entries failing the schema are reported and left out of the
+    # cross-checks.
+    for position, (field, gc) in enumerate(_iter_global_json(global_json_path)):
+        if field == "unassigned_clusters":
+            unassigned_clusters.append(gc)
+            continue
+
+        try:
+            record = GlobalClusterRecord.model_validate(gc)
+        except ValidationError as exc:
+            gid = gc.get("global_cluster_id") if isinstance(gc, dict) else None
+            label = gid if isinstance(gid, str) and gid.strip() else f"global_clusters[{position}]"
+            errors.append(_describe_validation_error(label, exc))
+            continue
+
+        gid = record.global_cluster_id
+        if gid in global_ids:
+            errors.append(f"Duplicate global_cluster_id '{gid}'")
         global_ids.add(gid)
 
-        provisional_label = gc.get("provisional_label")
-        normalized_issue_label = gc.get("normalized_issue_label")
-        short_description = gc.get("short_description")
-        member_cluster_ids = gc.get("member_cluster_ids")
-        total_num_posts = gc.get("total_num_posts")
-        num_clusters = gc.get("num_clusters")
-        num_courses = gc.get("num_courses")
-
-        _ensure(
-            isinstance(provisional_label, str) and provisional_label.strip(),
-            f"{gid}: provisional_label must be a non-empty string",
-        )
-        _ensure(
-            isinstance(normalized_issue_label, str)
-            and normalized_issue_label.strip(),
-            f"{gid}: normalized_issue_label must be a non-empty string",
+        gids.append(gid)
+        declared_clusters.append(record.num_clusters)
+        declared_posts.append(record.total_num_posts)
+        declared_courses.append(record.num_courses)
+        group_lengths.append(len(record.member_cluster_ids))
+        flat_members.extend(record.member_cluster_ids)
+
+    n_groups = len(gids)
+    declared_posts_arr = np.asarray(declared_posts, dtype=np.int64)
+
+    # Check sorted by total_num_posts descending.
+    for i in np.flatnonzero(np.diff(declared_posts_arr) > 0) + 1:
+        errors.append(
+            "global_clusters must be sorted by total_num_posts descending "
+            f"(entry {i}, {gids[i]}: {declared_posts[i]} > {declared_posts[i - 1]})"
         )
-        _ensure(
-            isinstance(short_description, str) and short_description.strip(),
-            f"{gid}: short_description must be a non-empty string",
-        )
-        _ensure(
-            isinstance(member_cluster_ids, list),
-            f"{gid}: member_cluster_ids must be a list",
-        )
-        _ensure(
-            isinstance(total_num_posts, int) and total_num_posts >= 0,
-            f"{gid}: total_num_posts must be a non-negative integer",
-        )
-        _ensure(
-            isinstance(num_clusters, int) and num_clusters >= 0,
-            f"{gid}: num_clusters must be a non-negative integer",
-        )
-        _ensure(
-            isinstance(num_courses, int) and num_courses >= 0,
-            f"{gid}: num_courses must be a non-negative integer",
+
+    lengths = np.asarray(group_lengths, dtype=np.int64)
+    group_of = np.repeat(np.arange(n_groups), lengths)
+
+    # Resolve members to index rows in one searchsorted call; -1 marks an
+    # unknown cluster_id.
+    member_arr = np.asarray(flat_members, dtype=str)
+    member_idx = cluster_index.rows_for(member_arr)
+    known = member_idx >= 0
+    for j in np.flatnonzero(~known):
+        errors.append(
+            f"{gids[group_of[j]]}: member_cluster_ids references unknown cluster_id "
+            f"'{flat_members[j]}'"
         )
 
-        # Check sorted by total_num_posts descending.
-        if last_total_posts is None:
-            last_total_posts = total_num_posts
-        else:
-            _ensure(
-                total_num_posts <= last_total_posts,
-                "global_clusters must be sorted by total_num_posts descending",
-            )
-            last_total_posts = total_num_posts
-
-        # Validate member_cluster_ids.
-        calc_total_posts = 0
-        courses_for_gc: Set[str] = set()
-        seen_members: Set[str] = set()
-
-        for cid in member_cluster_ids:
-            _ensure(
-                isinstance(cid, str) and cid.strip(),
-                f"{gid}: member_cluster_ids must contain only non-empty strings",
-            )
-            _ensure(
-                cid in all_cluster_ids,
-                f"{gid}: member_cluster_ids references unknown cluster_id '{cid}'",
-            )
-            _ensure(
-                cid not in assigned_ids,
-                f"cluster_id '{cid}' appears in multiple global clusters",
-            )
-            assigned_ids.add(cid)
-            seen_members.add(cid)
-
-            row = cluster_meta[cid]
-            try:
-                n_posts = int(row.get("num_posts", 0))
-            except (TypeError, ValueError):
-                n_posts = 0
-            calc_total_posts += n_posts
-            courses_for_gc.add(row.get("course_code", "").strip())
-
-        _ensure(
-            len(seen_members) == num_clusters,
-            f"{gid}: num_clusters={num_clusters} but found {len(seen_members)} "
-            "member_cluster_ids",
+    # One sort finds every cluster_id listed more than once across (or
+    # within) global clusters.
+    assigned_ids, counts = np.unique(member_arr, return_counts=True)
+    for cid in assigned_ids[counts > 1]:
+        errors.append(f"cluster_id '{cid}' appears in multiple global clusters")
+
+    # A group's member count is its slice length. Post and course totals
+    # are only compared for groups whose members all resolved; the unknown
+    # ids are already reported above.
+    # reduceat needs strictly non-empty segments; empty groups sum to 0.
+    calc_posts = np.zeros(n_groups, dtype=np.int64)
+    nonempty = lengths > 0
+    if member_idx.size:
+        member_posts = np.where(known, num_posts_arr[member_idx], 0)
+        starts = np.cumsum(lengths) - lengths
+        calc_posts[nonempty] = np.add.reduceat(member_posts, starts[nonempty])
+    calc_courses = (
+        pd.Series(course_arr[member_idx[known]])
+        .groupby(group_of[known])
+        .nunique()
+        .reindex(range(n_groups), fill_value=0)
+        .to_numpy()
+    )
+    resolved = np.bincount(group_of[~known], minlength=n_groups) == 0
+
+    for i in np.flatnonzero(lengths != np.asarray(declared_clusters, dtype=np.int64)):
+        errors.append(
+            f"{gids[i]}: num_clusters={declared_clusters[i]} but found {lengths[i]} "
+            "member_cluster_ids"
         )
-        _ensure(
-            calc_total_posts == total_num_posts,
-            f"{gid}: total_num_posts={total_num_posts} but sum(num_posts)={calc_total_posts}",
+    for i in np.flatnonzero(resolved & (calc_posts != declared_posts_arr)):
+        errors.append(
+            f"{gids[i]}: total_num_posts={declared_posts[i]} but sum(num_posts)={calc_posts[i]}"
         )
-        _ensure(
-            len(courses_for_gc) == num_courses,
-            f"{gid}: num_courses={num_courses} but unique course_codes={len(courses_for_gc)}",
+    for i in np.flatnonzero(resolved & (calc_courses != np.asarray(declared_courses, dtype=np.int64))):
+        errors.append(
+            f"{gids[i]}: num_courses={declared_courses[i]} but unique course_codes={calc_courses[i]}"
         )
 
-    # Validate unassigned_clusters.
-    unassigned_ids: Set[str] = set()
-    for cid in unassigned_clusters:
-        _ensure(
-            isinstance(cid, str) and cid.strip(),
-            "unassigned_clusters must contain only non-empty strings",
-        )
-        _ensure(
-            cid in all_cluster_ids,
-            f"unassigned_clusters references unknown cluster_id '{cid}'",
-        )
-        _ensure(
-            cid not in assigned_ids,
-            f"cluster_id '{cid}' appears both in global_clusters and unassigned_clusters",
+    # Validate unassigned_clusters; invalid entries are reported and skipped.
+    try:
+        _UNASSIGNED_ADAPTER.validate_python(unassigned_clusters)
+    except ValidationError as exc:
+        errors.append(_describe_validation_error("unassigned_clusters", exc))
+        invalid = {err["loc"][0] for err in exc.errors()}
+        unassigned_clusters = [
+            cid for k, cid in enumerate(unassigned_clusters) if k not in invalid
+        ]
+    unassigned_arr = np.asarray(unassigned_clusters, dtype=str)
+    for cid in unassigned_arr[cluster_index.rows_for(unassigned_arr) < 0]:
+        errors.append(f"unassigned_clusters references unknown cluster_id '{cid}'")
+    unassigned_ids = np.unique(unassigned_arr)
+    for cid in np.intersect1d(assigned_ids, unassigned_ids, assume_unique=True):
+        errors.append(
+            f"cluster_id '{cid}' appears both in global_clusters and unassigned_clusters"
         )
-        unassigned_ids.add(cid)
-
-    accounted_ids = assigned_ids | unassigned_ids
-    _ensure(
-        accounted_ids == all_cluster_ids,
-        "Not all cluster_ids from cluster_global_index.csv are accounted for. "
-        f"Missing={sorted(all_cluster_ids - accounted_ids)}, "
-        f"extra={sorted(accounted_ids - all_cluster_ids)}",
+
+    missing = np.setdiff1d(
+        cluster_index.cluster_ids,
+        np.concatenate([assigned_ids, unassigned_ids]),
+        assume_unique=True,
     )
+    if missing.size:
+        errors.append(
+            "Not all cluster_ids from cluster_global_index.csv are accounted for. "
+            f"Missing={sorted(missing.tolist())}, extra=[]"
+        )
+
+    if errors:
+        raise ValueError("\n".join(errors))
 
     logger.info(
         "Stage-3 global clusters validated: %d global clusters, %d assigned clusters, "
         "%d unassigned clusters.",
-        len(global_clusters),
-        len(assigned_ids),
-        len(unassigned_ids),
+        n_groups,
+        assigned_ids.size,
+        unassigned_ids.size,
     )
     print(
-        f"OK: {len(global_clusters)} global clusters; "
-        f"{len(assigned_ids)} assigned clusters; {len(unassigned_ids)} unassigned."
+        f"OK: {n_groups} global clusters; "
+        f"{assigned_ids.size} assigned clusters; {unassigned_ids.size} unassigned."
     )
 
 
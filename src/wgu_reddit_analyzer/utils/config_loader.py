@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 import os
+import re
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
 try:
@@ -13,27 +15,39 @@ except ImportError:
 REPO_ROOT = Path(__file__).resolve().parents[3]
 
 
-def load_env() -> None:
-    """Load .env from repo root without overwriting existing environment vars."""
-    dotenv_path = REPO_ROOT / ".env"
-    if not dotenv_path.exists():
-        return
+# KEY=VALUE lines; blank lines, comments and lines without "=" never match.
+_ENV_RE = re.compile(r"^[^\S\n]*([^#\s=][^=\n]*?)[^\S\n]*=(.*)$", re.MULTILINE)
 
+
+@lru_cache(maxsize=1)
+def _load_env_file(dotenv_path: Path, mtime_ns: int) -> None:
+    """Apply dotenv_path once per modification time (mtime_ns is the cache key)."""
     if _load_dotenv:
         _load_dotenv(dotenv_path=dotenv_path, override=False)
         return
 
-    for line in dotenv_path.read_text(encoding="utf-8").splitlines():
-        line = line.strip()
-        if not line or line.startswith("#") or "=" not in line:
-            continue
-        key, value = line.split("=", 1)
-        os.environ.setdefault(key.strip(), value.strip().strip('"').strip("'"))
+    for m in _ENV_RE.finditer(dotenv_path.read_text(encoding="utf-8")):
+        os.environ.setdefault(m.group(1), m.group(2).strip().strip('"').strip("'"))
 
 
-@dataclass
+def load_env() -> None:
+    """Load .env from repo root without overwriting existing environment vars."""
+    dotenv_path = REPO_ROOT / ".env"
+    try:
+        mtime_ns = dotenv_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return
+    _load_env_file(dotenv_path, mtime_ns)
+
+
+@dataclass(frozen=True)
 class AppCfg:
-    """Central configuration object for Reddit and LLM clients."""
+    """
+    Central configuration object for Reddit and LLM clients.
+
+    Frozen because get_config() hands the same instance to every caller;
+    use dataclasses.replace() for a modified copy.
+    """
     reddit_client_id: str | None = None
     reddit_client_secret: str | None = None
     reddit_user_agent: str | None = None
@@ -45,8 +59,14 @@ class AppCfg:
         return self.__dict__.copy()
 
 
+@lru_cache(maxsize=1)
 def get_config() -> AppCfg:
-    """Return AppCfg built from environment variables."""
+    """
+    Return AppCfg built from environment variables.
+
+    Built once and shared by every caller; use reload_config() to pick up
+    environment changes made afterwards.
+    """
     load_env()
     return AppCfg(
         reddit_client_id=os.getenv("REDDIT_CLIENT_ID"),
@@ -58,6 +78,12 @@ def get_config() -> AppCfg:
     )
 
 
+def reload_config() -> AppCfg:
+    """Drop the cached config and rebuild it from the current environment."""
+    get_config.cache_clear()
+    return get_config()
+
+
 def require_reddit_creds(cfg: AppCfg | None = None) -> None:
     """Raise if required Reddit credentials are missing."""
     cfg = cfg or get_config()
@@ -1,10 +1,12 @@
 """SQLite connection helpers for the WGU Reddit Analyzer."""
 
 from __future__ import annotations
+import atexit
 import os
 import sqlite3
+import threading
 from pathlib import Path
-from typing import List, Union
+from typing import Dict, List, Tuple, Union
 
 from .logging_utils import get_logger
 
@@ -16,21 +18,81 @@ DB_PATH = DB_DIR / "WGU-Reddit.db"
 DB_DIR.mkdir(parents=True, exist_ok=True)
 
 
+# Per-thread connections opened by get_db_connection: _local.conns maps
+# resolved path -> connection. _registry holds every open connection with its
+# owning thread so close_all_connections() can reach them all; bumping
+# _generation makes threads drop connections it has closed.
+_local = threading.local()
+_registry: List[Tuple[threading.Thread, sqlite3.Connection]] = []
+_registry_lock = threading.Lock()
+_generation = 0
+
+_PRAGMAS = (
+    "PRAGMA journal_mode=WAL;",
+    "PRAGMA synchronous=NORMAL;",
+    "PRAGMA cache_size=-64000;",
+    "PRAGMA temp_store=MEMORY;",
+)
+
+
 def get_db_connection(db_path: Union[Path, str, None] = None) -> sqlite3.Connection:
-    """Return SQLite connection; default is db/WGU-Reddit.db."""
+    """
+    Return SQLite connection; default is db/WGU-Reddit.db.
+
+    One connection is opened per thread and database path, then reused by
+    later calls from that thread. Callers should commit their work but not
+    close the connection; close_all_connections() runs at interpreter exit.
+    """
     raw = db_path or DB_PATH
     path = Path(os.path.expanduser(str(raw))).resolve()
+    key = str(path)
+
+    if getattr(_local, "generation", None) != _generation:
+        _local.conns = {}
+        _local.generation = _generation
+    conns: Dict[str, sqlite3.Connection] = _local.conns
+
+    conn = conns.get(key)
+    if conn is not None:
+        return conn
 
     if not path.parent.exists():
         logger.error("DB directory missing: %s", path.parent)
         raise sqlite3.OperationalError(f"DB directory missing: {path.parent}")
 
     logger.info("Opening DB at: %s", path)
-    conn = sqlite3.connect(str(path))
+    # check_same_thread=False only so close_all_connections() can close
+    # other threads' connections; each connection is used by one thread.
+    conn = sqlite3.connect(str(path), check_same_thread=False)
     conn.row_factory = sqlite3.Row
+    for pragma in _PRAGMAS:
+        conn.execute(pragma)
+
+    conns[key] = conn
+    with _registry_lock:
+        # Connections of threads that have exited can never be reused.
+        dead = [c for t, c in _registry if not t.is_alive()]
+        _registry[:] = [(t, c) for t, c in _registry if t.is_alive()]
+        _registry.append((threading.current_thread(), conn))
+    for stale in dead:
+        stale.close()
     return conn
 
 
+def close_all_connections() -> None:
+    """Close every connection opened by get_db_connection."""
+    global _generation
+    with _registry_lock:
+        conns = [c for _, c in _registry]
+        _registry.clear()
+        _generation += 1
+    for conn in conns:
+        conn.close()
+
+
+atexit.register(close_all_connections)
+
+
 def get_table_columns(conn: sqlite3.Connection, table: str) -> List[str]:
     """Return list of column names for a given table."""
     cur = conn.execute(f"PRAGMA table_info({table});")
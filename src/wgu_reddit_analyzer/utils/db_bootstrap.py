@@ -1,14 +1,213 @@
 """Bootstrap and maintain minimal SQLite schema for the WGU Reddit Analyzer."""
 
 from __future__ import annotations
+import hashlib
+import re
 import sqlite3
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Set
 
 # File path: src/wgu_reddit_analyzer/utils/db_bootstrap.py
 REPO_ROOT = Path(__file__).resolve().parents[3]
 DB_PATH = REPO_ROOT / "data" / "WGU-Reddit.db"
 
+# Tables (created if missing).
+_TABLES: Dict[str, str] = {
+    "subreddits": """
+        CREATE TABLE IF NOT EXISTS subreddits (
+          subreddit_id TEXT PRIMARY KEY,
+          name TEXT,
+          description TEXT,
+          is_nsfw INTEGER,
+          created_utc REAL,
+          rules TEXT,
+          sidebar_text TEXT
+        );
+    """,
+    "subreddit_stats": """
+        CREATE TABLE IF NOT EXISTS subreddit_stats (
+          subreddit_id TEXT,
+          captured_at REAL,
+          subscriber_count INTEGER,
+          active_users INTEGER,
+          posts_per_day REAL,
+          total_posts INTEGER
+        );
+    """,
+    "users": """
+        CREATE TABLE IF NOT EXISTS users (
+          username TEXT PRIMARY KEY,
+          karma_comment INTEGER,
+          karma_post INTEGER,
+          created_utc REAL,
+          first_captured_at REAL,
+          last_seen_at REAL
+        );
+    """,
+    "users_backup": """
+        CREATE TABLE IF NOT EXISTS users_backup (
+          username TEXT,
+          created_utc REAL,
+          is_promotional INTEGER,
+          karma_post INTEGER,
+          karma_comment INTEGER,
+          last_seen REAL,
+          first_captured_at REAL,
+          last_seen_at REAL
+        );
+    """,
+    "posts": """
+        CREATE TABLE IF NOT EXISTS posts (
+          post_id TEXT PRIMARY KEY,
+          subreddit_id TEXT,
+          username TEXT,
+          title TEXT,
+          selftext TEXT,
+          created_utc REAL,
+          edited_utc REAL,
+          score INTEGER,
+          upvote_ratio REAL,
+          is_promotional INTEGER,
+          is_removed INTEGER,
+          is_deleted INTEGER,
+          flair TEXT,
+          post_type TEXT,
+          num_comments INTEGER,
+          url TEXT,
+          permalink TEXT,
+          extra_metadata TEXT,
+          captured_at REAL,
+          matched_course_codes TEXT,
+          course_code TEXT,
+          course_code_count INTEGER,
+          vader_compound REAL,
+          processed_stage0_at REAL
+        );
+    """,
+    "comments": """
+        CREATE TABLE IF NOT EXISTS comments (
+          comment_id TEXT PRIMARY KEY,
+          post_id TEXT,
+          username TEXT,
+          parent_comment_id TEXT,
+          body TEXT,
+          created_utc REAL,
+          edited_utc REAL,
+          score INTEGER,
+          is_promotional INTEGER,
+          is_removed INTEGER,
+          is_deleted INTEGER,
+          extra_metadata TEXT,
+          captured_at REAL
+        );
+    """,
+    "posts_keyword": """
+        CREATE TABLE IF NOT EXISTS posts_keyword (
+          post_id TEXT,
+          subreddit_id TEXT,
+          username TEXT,
+          title TEXT,
+          selftext TEXT,
+          created_utc REAL,
+          edited_utc REAL,
+          score INTEGER,
+          upvote_ratio REAL,
+          is_promotional INTEGER,
+          is_removed INTEGER,
+          is_deleted INTEGER,
+          flair TEXT,
+          post_type TEXT,
+          num_comments INTEGER,
+          url TEXT,
+          permalink TEXT,
+          search_terms TEXT,
+          captured_at REAL
+        );
+    """,
+    "comments_keyword": """
+        CREATE TABLE IF NOT EXISTS comments_keyword (
+          comment_id TEXT,
+          post_id TEXT,
+          subreddit_id TEXT,
+          username TEXT,
+          body TEXT,
+          created_utc REAL,
+          edited_utc REAL,
+          score INTEGER,
+          is_removed INTEGER,
+          is_deleted INTEGER,
+          parent_id TEXT,
+          depth INTEGER,
+          search_terms TEXT,
+          captured_at REAL
+        );
+    """,
+    "run_log": """
+        CREATE TABLE IF NOT EXISTS run_log (
+          run_id INTEGER PRIMARY KEY AUTOINCREMENT,
+          started_at REAL,
+          finished_at REAL,
+          seeds_read INTEGER,
+          posts_attempted INTEGER,
+          comments_inserted INTEGER,
+          failures INTEGER
+        );
+    """,
+    "user_map": """
+        CREATE TABLE IF NOT EXISTS user_map (
+          user_id INTEGER PRIMARY KEY AUTOINCREMENT,
+          username TEXT
+        );
+    """,
+}
+
+# Columns (safe adds only).
+_COLUMNS: Dict[str, Dict[str, str]] = {
+    "subreddits": {
+        "subreddit_id": "TEXT",
+        "name": "TEXT",
+        "description": "TEXT",
+        "is_nsfw": "INTEGER",
+        "created_utc": "REAL",
+        "rules": "TEXT",
+        "sidebar_text": "TEXT",
+    },
+    "subreddit_stats": {
+        "subreddit_id": "TEXT",
+        "captured_at": "REAL",
+        "subscriber_count": "INTEGER",
+        "active_users": "INTEGER",
+        "posts_per_day": "REAL",
+        "total_posts": "INTEGER",
+    },
+    "users": {
+        "username": "TEXT",
+        "karma_comment": "INTEGER",
+        "karma_post": "INTEGER",
+        "created_utc": "REAL",
+        "first_captured_at": "REAL",
+        "last_seen_at": "REAL",
+    },
+    "posts": {
+        "matched_course_codes": "TEXT",
+        "course_code": "TEXT",
+        "course_code_count": "INTEGER",
+        "vader_compound": "REAL",
+        "processed_stage0_at": "REAL",
+    },
+    "comments": {"parent_comment_id": "TEXT"},
+}
+
+# Indexes (created if missing).
+_INDEXES: Dict[str, str] = {
+    # Lets the fetchers' per-subreddit MAX(created_utc) frontier lookup walk
+    # the index from the newest post instead of scanning the table.
+    "idx_posts_created_utc": "CREATE INDEX IF NOT EXISTS idx_posts_created_utc ON posts(created_utc);",
+}
+
+# Fingerprint of the desired schema; any edit to _TABLES, _COLUMNS or _INDEXES changes it.
+_SCHEMA_HASH = hashlib.sha1(repr((_TABLES, _COLUMNS, _INDEXES)).encode("utf-8")).hexdigest()
+
 
 def _get_existing_schema(conn: sqlite3.Connection) -> Dict[str, List[str]]:
     """Return a map of table -> column names."""
@@ -26,25 +225,55 @@ def _get_existing_schema(conn: sqlite3.Connection) -> Dict[str, List[str]]:
     return out
 
 
-def _ensure_table(conn: sqlite3.Connection, table: str, create_sql: str) -> None:
-    """Create a table if it does not exist."""
-    cur = conn.cursor()
-    cur.execute(
-        "SELECT name FROM sqlite_master WHERE type='table' AND name=?;",
-        (table,),
-    )
-    if cur.fetchone() is None:
-        cur.execute(create_sql)
+_DDL_COLUMN_RE = re.compile(r"^\s*(\w+)\s+[A-Z]", re.MULTILINE)
 
 
-def _ensure_columns(conn: sqlite3.Connection, table: str, desired_cols: Dict[str, str]) -> None:
-    """Add missing columns without dropping or altering existing ones."""
-    cur = conn.cursor()
-    cur.execute(f"PRAGMA table_info({table});")
-    existing = {r[1] for r in cur.fetchall()}
-    for col, decl in desired_cols.items():
-        if col not in existing:
-            cur.execute(f"ALTER TABLE {table} ADD COLUMN {col} {decl}")
+def _ddl_columns(create_sql: str) -> Set[str]:
+    """Column names declared by one of the CREATE TABLE statements above."""
+    return set(_DDL_COLUMN_RE.findall(create_sql.split("(", 1)[1]))
+
+
+def _stored_schema_hash(conn: sqlite3.Connection) -> str | None:
+    """Return the schema fingerprint written by the last bootstrap, if any."""
+    try:
+        row = conn.execute("SELECT hash FROM _schema_meta LIMIT 1;").fetchone()
+    except sqlite3.OperationalError:
+        return None
+    return row[0] if row else None
+
+
+def _bootstrap_script(schema: Dict[str, List[str]]) -> str:
+    """
+    Build one transaction with every CREATE TABLE / ADD COLUMN still missing
+    from schema, the CREATE INDEX IF NOT EXISTS statements, plus the
+    fingerprint update.
+    """
+    stmts: List[str] = ["BEGIN;"]
+
+    for table, create_sql in _TABLES.items():
+        if table not in schema:
+            stmts.append(create_sql.strip())
+
+    for table, desired_cols in _COLUMNS.items():
+        if table in schema:
+            existing = set(schema[table])
+        else:
+            existing = _ddl_columns(_TABLES.get(table, "("))
+        stmts.extend(
+            f"ALTER TABLE {table} ADD COLUMN {col} {decl};"
+            for col, decl in desired_cols.items()
+            if col not in existing
+        )
+
+    stmts.extend(_INDEXES.values())
+
+    stmts.extend([
+        "CREATE TABLE IF NOT EXISTS _schema_meta (hash TEXT);",
+        "DELETE FROM _schema_meta;",
+        f"INSERT INTO _schema_meta (hash) VALUES ('{_SCHEMA_HASH}');",
+        "COMMIT;",
+    ])
+    return "\n".join(stmts)
 
 
 def ensure_minimal_schema(db_path: Path | None = None) -> None:
@@ -52,211 +281,26 @@ def ensure_minimal_schema(db_path: Path | None = None) -> None:
     Idempotently bootstrap the SQLite database:
     - Creates required tables if missing.
     - Adds missing columns as needed.
+    - Creates missing indexes.
     - Never drops or modifies existing columns.
+
+    The existing schema is read once. A fingerprint of the desired schema is
+    stored in _schema_meta; when it matches, the database was already
+    bootstrapped with this schema and nothing else is queried. Otherwise all
+    missing DDL runs as one script in a single transaction (one fsync).
     """
     path = Path(db_path) if db_path else DB_PATH
     path.parent.mkdir(parents=True, exist_ok=True)
 
     conn = sqlite3.connect(path)
     try:
-        schema = _get_existing_schema(conn)
-
-        # Tables
-        _ensure_table(conn, "subreddits", """
-            CREATE TABLE IF NOT EXISTS subreddits (
-              subreddit_id TEXT PRIMARY KEY,
-              name TEXT,
-              description TEXT,
-              is_nsfw INTEGER,
-              created_utc REAL,
-              rules TEXT,
-              sidebar_text TEXT
-            );
-        """)
-
-        _ensure_table(conn, "subreddit_stats", """
-            CREATE TABLE IF NOT EXISTS subreddit_stats (
-              subreddit_id TEXT,
-              captured_at REAL,
-              subscriber_count INTEGER,
-              active_users INTEGER,
-              posts_per_day REAL,
-              total_posts INTEGER
-            );
-        """)
-
-        _ensure_table(conn, "users", """
-            CREATE TABLE IF NOT EXISTS users (
-              username TEXT PRIMARY KEY,
-              karma_comment INTEGER,
-              karma_post INTEGER,
-              created_utc REAL,
-              first_captured_at REAL,
-              last_seen_at REAL
-            );
-        """)
-
-        _ensure_table(conn, "users_backup", """
-            CREATE TABLE IF NOT EXISTS users_backup (
-              username TEXT,
-              created_utc REAL,
-              is_promotional INTEGER,
-              karma_post INTEGER,
-              karma_comment INTEGER,
-              last_seen REAL,
-              first_captured_at REAL,
-              last_seen_at REAL
-            );
-        """)
-
-        _ensure_table(conn, "posts", """
-            CREATE TABLE IF NOT EXISTS posts (
-              post_id TEXT PRIMARY KEY,
-              subreddit_id TEXT,
-              username TEXT,
-              title TEXT,
-              selftext TEXT,
-              created_utc REAL,
-              edited_utc REAL,
-              score INTEGER,
-              upvote_ratio REAL,
-              is_promotional INTEGER,
-              is_removed INTEGER,
-              is_deleted INTEGER,
-              flair TEXT,
-              post_type TEXT,
-              num_comments INTEGER,
-              url TEXT,
-              permalink TEXT,
-              extra_metadata TEXT,
-              captured_at REAL,
-              matched_course_codes TEXT,
-              course_code TEXT,
-              course_code_count INTEGER,
-              vader_compound REAL,
-              processed_stage0_at REAL
-            );
-        """)
-
-        _ensure_table(conn, "comments", """
-            CREATE TABLE IF NOT EXISTS comments (
-              comment_id TEXT PRIMARY KEY,
-              post_id TEXT,
-              username TEXT,
-              parent_comment_id TEXT,
-              body TEXT,
-              created_utc REAL,
-              edited_utc REAL,
-              score INTEGER,
-              is_promotional INTEGER,
-              is_removed INTEGER,
-              is_deleted INTEGER,
-              extra_metadata TEXT,
-              captured_at REAL
-            );
-        """)
-
-        _ensure_table(conn, "posts_keyword", """
-            CREATE TABLE IF NOT EXISTS posts_keyword (
-              post_id TEXT,
-              subreddit_id TEXT,
-              username TEXT,
-              title TEXT,
-              selftext TEXT,
-              created_utc REAL,
-              edited_utc REAL,
-              score INTEGER,
-              upvote_ratio REAL,
-              is_promotional INTEGER,
-              is_removed INTEGER,
-              is_deleted INTEGER,
-              flair TEXT,
-              post_type TEXT,
-              num_comments INTEGER,
-              url TEXT,
-              permalink TEXT,
-              search_terms TEXT,
-              captured_at REAL
-            );
-        """)
+        if _stored_schema_hash(conn) == _SCHEMA_HASH:
+            return
 
-        _ensure_table(conn, "comments_keyword", """
-            CREATE TABLE IF NOT EXISTS comments_keyword (
-              comment_id TEXT,
-              post_id TEXT,
-              subreddit_id TEXT,
-              username TEXT,
-              body TEXT,
-              created_utc REAL,
-              edited_utc REAL,
-              score INTEGER,
-              is_removed INTEGER,
-              is_deleted INTEGER,
-              parent_id TEXT,
-              depth INTEGER,
-              search_terms TEXT,
-              captured_at REAL
-            );
-        """)
-
-        _ensure_table(conn, "run_log", """
-            CREATE TABLE IF NOT EXISTS run_log (
-              run_id INTEGER PRIMARY KEY AUTOINCREMENT,
-              started_at REAL,
-              finished_at REAL,
-              seeds_read INTEGER,
-              posts_attempted INTEGER,
-              comments_inserted INTEGER,
-              failures INTEGER
-            );
-        """)
-
-        _ensure_table(conn, "user_map", """
-            CREATE TABLE IF NOT EXISTS user_map (
-              user_id INTEGER PRIMARY KEY AUTOINCREMENT,
-              username TEXT
-            );
-        """)
-
-        # Columns (safe adds only)
-        _ensure_columns(conn, "subreddits", {
-            "subreddit_id": "TEXT",
-            "name": "TEXT",
-            "description": "TEXT",
-            "is_nsfw": "INTEGER",
-            "created_utc": "REAL",
-            "rules": "TEXT",
-            "sidebar_text": "TEXT",
-        })
-
-        _ensure_columns(conn, "subreddit_stats", {
-            "subreddit_id": "TEXT",
-            "captured_at": "REAL",
-            "subscriber_count": "INTEGER",
-            "active_users": "INTEGER",
-            "posts_per_day": "REAL",
-            "total_posts": "INTEGER",
-        })
-
-        _ensure_columns(conn, "users", {
-            "username": "TEXT",
-            "karma_comment": "INTEGER",
-            "karma_post": "INTEGER",
-            "created_utc": "REAL",
-            "first_captured_at": "REAL",
-            "last_seen_at": "REAL",
-        })
-
-        _ensure_columns(conn, "posts", {
-            "matched_course_codes": "TEXT",
-            "course_code": "TEXT",
-            "course_code_count": "INTEGER",
-            "vader_compound": "REAL",
-            "processed_stage0_at": "REAL",
-        })
-
-        _ensure_columns(conn, "comments", {"parent_comment_id": "TEXT"})
+        schema = _get_existing_schema(conn)
 
-        conn.commit()
+        conn.execute("PRAGMA journal_mode=WAL;")
+        conn.execute("PRAGMA synchronous=NORMAL;")
+        conn.executescript(_bootstrap_script(schema))
     finally:
-        conn.close()
\ No newline at end of file
+        conn.close()
@@ -1,11 +1,38 @@
 """Course and sentiment filters for WGU Reddit Analyzer."""
 
 from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from hashlib import blake2b
+import os
 from pathlib import Path
 import re
+from typing import NamedTuple
+import numpy as np
 import pandas as pd
 
+try:
+    import hyperscan  # type: ignore
+except ImportError:
+    hyperscan = None
+
+try:
+    import ahocorasick  # type: ignore
+except ImportError:
+    ahocorasick = None
+
+try:
+    import pyarrow as pa  # type: ignore
+    import pyarrow.csv as pacsv  # type: ignore
+except ImportError:
+    pa = pacsv = None
+
 COURSE_CSV = Path("data/course_list_with_college.csv")
+PATTERN_CACHE_DIR = Path("data/.cache")
+
+# Below this many rows per worker, process startup and per-worker matcher
+# compilation cost more than the matching they offload.
+MIN_ROWS_PER_WORKER = 5_000
 
 
 def normalize_code(code: str) -> str:
@@ -13,33 +40,300 @@ def normalize_code(code: str) -> str:
     return str(code).upper().replace("-", "").replace(" ", "")
 
 
-def _build_course_patterns(course_codes):
-    """Return {normalized_code: compiled_regex} allowing dash/space variants."""
-    patterns = {}
-    for raw in (course_codes or []):
-        code = normalize_code(raw)
+def _course_inner(code: str):
+    """Return (regex body, match key) for a normalized code, allowing dash/space variants."""
+    letters = "".join(c for c in code if c.isalpha())
+    digits = "".join(c for c in code if c.isdigit())
+    if letters and digits:
+        return rf"{re.escape(letters)}(?:[ -]?){re.escape(digits)}", letters + digits
+    return rf"{re.escape(code)}", code
+
+
+class _CoursePatterns(NamedTuple):
+    """
+    Compiled matchers for a set of course codes.
+
+    master is one alternation of all codes; a match, uppercased with
+    dashes/spaces removed, is a key of keys (match_key -> codes). hs is the
+    Hyperscan matcher (see _build_hyperscan_db) and automaton the literal
+    prefilter used in front of master (see _build_prefilter); each is None
+    when its package is not installed.
+    """
+
+    master: re.Pattern
+    keys: dict
+    hs: tuple | None
+    automaton: object | None
+
+
+@lru_cache(maxsize=8)
+def _build_course_patterns(codes):
+    """
+    Return _CoursePatterns for a sorted tuple of normalized codes, or None if
+    no code is usable. Cached, so results are shared and never mutated.
+    """
+    keys = {}
+    inners = {}
+    for code in codes:
         if len(code) < 2:
             continue
-        letters = "".join(c for c in code if c.isalpha())
-        digits = "".join(c for c in code if c.isdigit())
-        if letters and digits:
-            inner = rf"{re.escape(letters)}(?:[ -]?){re.escape(digits)}"
-        else:
-            inner = rf"{re.escape(code)}"
-        pat = re.compile(rf"(?<![A-Za-z0-9])(?:{inner})(?![A-Za-z0-9])", re.I)
-        patterns[code] = pat
-    return patterns
+        inner, key = _course_inner(code)
+        keys.setdefault(key, set()).add(code)
+        inners[inner] = key
+    if not inners:
+        return None
+    # Longest alternatives first so a shorter code cannot shadow a longer one.
+    alternation = "|".join(sorted(inners, key=len, reverse=True))
+    master = re.compile(rf"(?<![A-Za-z0-9])(?:{alternation})(?![A-Za-z0-9])", re.I)
+    hs = _build_hyperscan_db(inners, keys)
+    return _CoursePatterns(
+        master=master,
+        keys=keys,
+        hs=hs,
+        # Hyperscan already prefilters on literals internally; the
+        # automaton only pays off in front of the regex.
+        automaton=_build_prefilter(keys) if hs is None else None,
+    )
+
+
+def _build_prefilter(keys):
+    """
+    Build an Aho-Corasick automaton over the match keys, or None without
+    pyahocorasick.
+
+    Every code match, with dashes/spaces removed, is a key, so text with
+    dashes/spaces removed that contains no key cannot match any code.
+    """
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for key in keys:
+        automaton.add_word(key, key)
+    automaton.make_automaton()
+    return automaton
+
+
+# Deletes the dash/space separators codes may be written with, in one pass.
+_SQUASH_SEPARATORS = str.maketrans("", "", " -")
+
+
+def _has_candidate(automaton, text):
+    """True if text contains any prefilter key."""
+    for _ in automaton.iter(text):
+        return True
+    return False
+
+
+def _build_hyperscan_db(inners, keys):
+    """
+    Compile every code pattern into one Hyperscan block-mode database.
+
+    Returns (db, id_codes) where id_codes[expression_id] is the set of codes
+    that expression matches, or None when hyperscan is not installed.
+
+    Hyperscan has no lookaround, so the alnum boundaries are consumed
+    instead; it reports overlapping matches, so adjacent codes still match.
+    Byte mode is exact because texts are folded by _match_case first: every
+    character re.I treats as [A-Za-z0-9] is then ASCII. Compiled databases are cached under PATTERN_CACHE_DIR across runs.
+    """
+    if hyperscan is None:
+        return None
+    exprs = [
+        rf"(?:^|[^A-Za-z0-9])(?:{inner})(?:$|[^A-Za-z0-9])".encode("utf-8")
+        for inner in inners
+    ]
+    flags = hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH
+    cache_path = _hyperscan_cache_path(exprs, flags)
+    db = _load_hyperscan_db(cache_path)
+    if db is None:
+        db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+        db.compile(
+            expressions=exprs,
+            ids=list(range(len(exprs))),
+            elements=len(exprs),
+            flags=[flags] * len(exprs),
+        )
+        _store_hyperscan_db(cache_path, db)
+    return db, [keys[key] for key in inners.values()]
+
+
+def _hyperscan_cache_path(exprs, flags) -> Path:
+    """Cache file for a compiled database, keyed by its expressions and flags."""
+    h = blake2b(digest_size=16)
+    h.update(str(flags).encode("ascii"))
+    h.update(b"\n".join(exprs))
+    return PATTERN_CACHE_DIR / f"course_hs_{h.hexdigest()}.db"
+
+
+def _load_hyperscan_db(path: Path):
+    """
+    Return the database cached at path, or None if there is none or it was
+    built by another Hyperscan version/platform.
+    """
+    try:
+        db = hyperscan.loadb(path.read_bytes(), hyperscan.HS_MODE_BLOCK)
+        # compile() allocates scratch space; a deserialized database has none.
+        db.scratch = hyperscan.Scratch(db)
+    except (OSError, hyperscan.error):
+        return None
+    return db
+
+
+def _store_hyperscan_db(path: Path, db) -> None:
+    """Serialize db to path; best effort, since it can always be rebuilt."""
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        PATTERN_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_bytes(hyperscan.dumpb(db))
+        os.replace(tmp_path, path)
+    except (OSError, hyperscan.error):
+        tmp_path.unlink(missing_ok=True)
+
+
+def _hyperscan_codes(db, id_codes, text, cap=None):
+    """
+    Return sorted unique codes matched in text with one Hyperscan pass, or
+    None as soon as more than cap codes are found.
+    """
+    found = set()
 
+    def on_match(expr_id, start, end, flags, context):
+        found.update(id_codes[expr_id])
+        # A truthy return stops the scan.
+        return cap is not None and len(found) > cap
 
-def _combine_text(row, title_col="title", text_col="text", selftext_fallback="selftext"):
-    """Combine title and text fields with safe fallbacks."""
-    title = row.get(title_col) or ""
-    body = row.get(text_col) or row.get(selftext_fallback) or ""
-    if not isinstance(title, str):
-        title = ""
-    if not isinstance(body, str):
-        body = ""
-    return f"{title} {body}"
+    try:
+        # Byte mode: lone surrogates pass through as non-alnum bytes.
+        db.scan(text.encode("utf-8", "surrogatepass"), match_event_handler=on_match)
+    except hyperscan.ScanTerminated:
+        return None
+    return sorted(found)
+
+
+@lru_cache(maxsize=1)
+def _read_course_codes(path: Path, mtime_ns: int):
+    """Read CourseCode from path once per modification time (mtime_ns is the cache key)."""
+    if pacsv is not None:
+        # Arrow's C++ reader; empty cells become nulls like pandas' NaN.
+        table = pacsv.read_csv(
+            path,
+            convert_options=pacsv.ConvertOptions(
+                include_columns=["CourseCode"],
+                column_types={"CourseCode": pa.string()},
+                strings_can_be_null=True,
+            ),
+        )
+        return tuple(c for c in table.column("CourseCode").to_pylist() if c is not None)
+    return tuple(pd.read_csv(path, usecols=["CourseCode"])["CourseCode"].dropna().tolist())
+
+
+def load_course_codes(path: Path = COURSE_CSV):
+    """
+    Return the CourseCode values in path as a tuple.
+
+    Parsed once per file modification time; raises FileNotFoundError if
+    path does not exist.
+    """
+    path = Path(path)
+    return _read_course_codes(path, path.stat().st_mtime_ns)
+
+
+def _default_course_codes():
+    """Course codes from COURSE_CSV, or () if it does not exist."""
+    try:
+        return load_course_codes(COURSE_CSV)
+    except FileNotFoundError:
+        return ()
+
+
+def _text_or_empty(s: pd.Series) -> pd.Series:
+    """Replace non-string cells with ''."""
+    if pd.api.types.infer_dtype(s, skipna=True) == "string":
+        # Only strings and missing values: a C-level fillna is enough.
+        return s.fillna("").astype(object)
+    # astype keeps an empty non-object column (e.g. float64) concatenable.
+    return s.where(s.map(type).eq(str), "").astype(object)
+
+
+# Letters that survive .upper() but that re.I still equates with ASCII ones:
+# "İ" (U+0130) matches I and the Kelvin sign (U+212A) matches K. Folding them
+# gives every matcher the text the per-code re.I patterns saw, with ASCII-only
+# code letters and boundaries.
+_MATCH_FOLD = str.maketrans({"\u0130": "I", "\u212a": "K"})
+
+
+def _match_case(text):
+    """Uppercase text for course matching (see _MATCH_FOLD)."""
+    text = text.upper()
+    return text if text.isascii() else text.translate(_MATCH_FOLD)
+
+
+def _combine_text_series(df, title_col="title", text_col="text", selftext_fallback="selftext", upper=False):
+    """
+    Combine title and text columns; empty text falls back to selftext, non-strings become ''.
+
+    upper=True applies _match_case in the same pass as the join instead of a
+    second scan over the combined column.
+    """
+    empty = pd.Series("", index=df.index, dtype=object)
+    title = df[title_col] if title_col in df.columns else empty
+    body = df[text_col] if text_col in df.columns else empty
+    if selftext_fallback in df.columns:
+        body = body.where(body.notna() & body.ne(""), df[selftext_fallback])
+    title, body = _text_or_empty(title), _text_or_empty(body)
+    if upper:
+        return pd.Series(
+            [_match_case(t + " " + b) for t, b in zip(title, body)], index=df.index, dtype=object
+        )
+    return title + " " + body
+
+
+def _match_capped(text, master, keys, cap=None):
+    """
+    Return the sorted unique codes master finds in text, or None as soon as
+    more than cap distinct codes have been seen (cap=None never stops early).
+    """
+    matched = set()
+    for m in master.finditer(text):
+        matched.update(keys[m.group().replace(" ", "").replace("-", "")])
+        if cap is not None and len(matched) > cap:
+            return None
+    return sorted(matched)
+
+
+def _match_texts(pats, texts, cap=None):
+    """
+    Return the sorted unique course codes found in each uppercased text.
+
+    With cap set, a text stops scanning once it names more than cap codes
+    and gets None instead of its list.
+    """
+    if pats.hs is not None:
+        # Hyperscan matches all codes simultaneously in one DFA pass.
+        hs_db, id_codes = pats.hs
+
+        def match_codes(text):
+            return _hyperscan_codes(hs_db, id_codes, text, cap)
+    else:
+        # One scan per row with a single alternation, instead of one
+        # search per course code.
+        def match_codes(text):
+            return _match_capped(text, pats.master, pats.keys, cap)
+
+    if pats.automaton is None:
+        return [match_codes(t) for t in texts]
+
+    # Most posts name no course at all; skip the matcher for them.
+    squashed = texts.str.translate(_SQUASH_SEPARATORS)
+    return [
+        match_codes(t) if _has_candidate(pats.automaton, sq) else []
+        for t, sq in zip(texts, squashed)
+    ]
+
+
+def _match_chunk(texts, codes, cap=None):
+    """Process-pool worker: match one chunk of texts (matchers are cached per worker)."""
+    return _match_texts(_build_course_patterns(codes), pd.Series(texts, dtype=object), cap)
 
 
 def filter_posts_by_course_code(
@@ -49,31 +343,63 @@ def filter_posts_by_course_code(
     title_col: str = "title",
     text_col: str = "text",
     out_col: str = "matched_course_codes",
+    n_jobs: int = 1,
 ) -> pd.DataFrame:
-    """Keep rows mentioning a specific number of distinct course codes."""
-    df = df.copy()
+    """
+    Keep rows mentioning a specific number of distinct course codes.
+
+    n_jobs > 1 splits the rows across that many worker processes
+    (n_jobs <= 0 uses every CPU), never giving a worker fewer than
+    MIN_ROWS_PER_WORKER rows; 1 matches in-process.
+    """
     if course_codes is None:
-        if COURSE_CSV.exists():
-            course_codes = pd.read_csv(COURSE_CSV, usecols=["CourseCode"])["CourseCode"].dropna().tolist()
-        else:
-            course_codes = []
+        course_codes = _default_course_codes()
+
+    codes = tuple(sorted({normalize_code(c) for c in course_codes}))
+    pats = _build_course_patterns(codes)
+    # Only rows with exactly this many codes are kept, so a row can stop
+    # scanning once it exceeds it (its list becomes None).
+    cap = int(exact_match_count)
 
-    pats = _build_course_patterns(course_codes)
+    if pats is None:
+        matched = [[] for _ in range(len(df))]
+    else:
+        texts = _combine_text_series(df, title_col=title_col, text_col=text_col, upper=True)
+        workers = (os.cpu_count() or 1) if n_jobs <= 0 else n_jobs
+        workers = min(workers, len(texts) // MIN_ROWS_PER_WORKER)
+        if workers > 1:
+            chunks = [c.tolist() for c in np.array_split(texts.to_numpy(dtype=object), workers)]
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                parts = executor.map(_match_chunk, chunks, [codes] * len(chunks), [cap] * len(chunks))
+                matched = [m for part in parts for m in part]
+        else:
+            matched = _match_texts(pats, texts, cap)
+    keep = np.array([m is not None and len(m) == cap for m in matched], dtype=bool)
+    # Boolean indexing already returns a new frame; assign adds the column
+    # to it without copying the caller's frame first.
+    out = df[keep]
+    kept = pd.Series([m for m, k in zip(matched, keep) if k], index=out.index, dtype=object)
+    return out.assign(**{out_col: kept})
 
-    def match_codes(row):
-        text = _combine_text(row, title_col=title_col, text_col=text_col).upper()
-        return sorted({code for code, pat in pats.items() if pat.search(text)})
 
-    df[out_col] = df.apply(match_codes, axis=1)
-    return df[df[out_col].apply(len) == int(exact_match_count)]
+@lru_cache(maxsize=8)
+def _word_pattern(course_codes):
+    """Case-insensitive whole-word alternation of course_codes (RE2-compatible)."""
+    return r"(?i)\b(?:" + "|".join(map(re.escape, course_codes)) + r")\b"
 
 
 def filter_by_course_exact(df, text_col="text", course_codes=None):
     """Simple exact match using raw course codes and word boundaries."""
     if not course_codes:
         return df
-    pat = re.compile(r"\b(" + "|".join(map(re.escape, course_codes)) + r")\b", re.I)
-    return df[df[text_col].fillna("").str.contains(pat, regex=True)]
+    text = df[text_col].fillna("")
+    try:
+        # Arrow-backed strings run the regex column-wise in C++.
+        text = text.astype("string[pyarrow]")
+    except ImportError:
+        pass
+    mask = text.str.contains(_word_pattern(tuple(course_codes)), regex=True)
+    return df[mask.to_numpy(dtype=bool)]
 
 
 def filter_by_vader(df, score_col="vader_compound", threshold=-0.2):
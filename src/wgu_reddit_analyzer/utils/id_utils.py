@@ -10,6 +10,21 @@ def make_pain_point_id(course: str, post_id: str, idx: int) -> str:
     return f"{course}_{post_id}[{idx}]"
 
 
+def _is_id_part(part: str) -> bool:
+    """Non-empty and only ASCII letters, digits or '-'."""
+    return bool(part) and part.isascii() and part.replace("-", "0").isalnum()
+
+
 def is_valid_pain_point_id(s: str) -> bool:
-    """Check if string matches pain-point ID format."""
-    return bool(s and ID_RE.match(s))
\ No newline at end of file
+    """
+    Check if string matches pain-point ID format (ID_RE as a full match).
+
+    Checked with str methods instead of the regex, since this runs per ID.
+    """
+    if not s or s[-1] != "]":
+        return False
+    lb = s.rfind("[")
+    if lb < 0 or not s[lb + 1:-1].isdecimal():
+        return False
+    us = s.rfind("_", 0, lb)
+    return us >= 0 and _is_id_part(s[:us]) and _is_id_part(s[us + 1:lb])
\ No newline at end of file
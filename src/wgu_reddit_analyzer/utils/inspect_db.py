@@ -13,10 +13,22 @@ DB_PATH = REPO_ROOT / "db" / "WGU-Reddit.db"
 ALLOWLIST_PATH = REPO_ROOT / "data" / "wgu_subreddits.txt"
 
 
+# Read-side tuning: serve hot pages via mmap and a larger page cache.
+_READ_PRAGMAS = (
+    "PRAGMA mmap_size=1073741824;",
+    "PRAGMA cache_size=-131072;",
+    "PRAGMA temp_store=MEMORY;",
+)
+
+
 def get_connection(db_path: Path | None = None) -> sqlite3.Connection:
     path = Path(db_path) if db_path else DB_PATH
-    conn = sqlite3.connect(path)
+    # mode=ro keeps the main DB read-only while still allowing TEMP tables
+    # (PRAGMA query_only would block those too).
+    conn = sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True)
     conn.row_factory = sqlite3.Row
+    for pragma in _READ_PRAGMAS:
+        conn.execute(pragma)
     return conn
 
 
@@ -28,37 +40,27 @@ def load_allowlist(path: Path) -> Set[str]:
     }
 
 
-def placeholders(n: int) -> str:
-    return ",".join(["?"] * n)
-
-
 def get_posts_columns(conn: sqlite3.Connection) -> List[str]:
     cols = conn.execute("PRAGMA table_info(posts);").fetchall()
     return [c["name"] if isinstance(c, sqlite3.Row) else c[1] for c in cols]
 
 
 def print_overview(conn: sqlite3.Connection, allow: Set[str]) -> None:
-    ph = placeholders(len(allow))
-    params = tuple(sorted(allow))
-
-    (post_count,) = conn.execute(
-        f"""
-        SELECT COUNT(*)
-        FROM posts p
-        JOIN subreddits s ON s.subreddit_id = p.subreddit_id
-        WHERE s.name IN ({ph})
-        """,
-        params,
-    ).fetchone()
-
-    (subreddit_count,) = conn.execute(
-        f"""
-        SELECT COUNT(DISTINCT s.name)
+    # The allowlist goes into a keyed temp table rather than an IN (?, ...)
+    # list, so it can be joined by index and never hits the host-parameter
+    # limit.
+    conn.execute("DROP TABLE IF EXISTS temp._allow")
+    conn.execute("CREATE TEMP TABLE _allow (name TEXT PRIMARY KEY) WITHOUT ROWID")
+    conn.executemany("INSERT INTO temp._allow (name) VALUES (?)", [(n,) for n in sorted(allow)])
+
+    # Both counts come from one pass over the join.
+    post_count, subreddit_count = conn.execute(
+        """
+        SELECT COUNT(*), COUNT(DISTINCT s.name)
         FROM posts p
         JOIN subreddits s ON s.subreddit_id = p.subreddit_id
-        WHERE s.name IN ({ph})
-        """,
-        params,
+        JOIN temp._allow a ON a.name = s.name
+        """
     ).fetchone()
 
     print("DB Snapshot Overview")
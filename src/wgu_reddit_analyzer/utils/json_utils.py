@@ -0,0 +1,57 @@
+"""JSON encode/decode helpers: use orjson (or jiter for parsing) when installed, stdlib json otherwise."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson as _orjson  # type: ignore
+except ImportError:
+    _orjson = None
+
+try:
+    import jiter as _jiter  # type: ignore
+except ImportError:
+    _jiter = None
+
+# json.dumps builds a new JSONEncoder per call whenever options are passed;
+# hoist the two configurations used by the stdlib fallback.
+_encode_compact = json.JSONEncoder(ensure_ascii=False).encode
+_encode_indent = json.JSONEncoder(ensure_ascii=False, indent=2).encode
+
+
+def loads(data: str | bytes) -> Any:
+    """Parse a JSON document from str or UTF-8 bytes."""
+    if _orjson is not None:
+        try:
+            return _orjson.loads(data)
+        except _orjson.JSONDecodeError:
+            # orjson rejects NaN/Infinity and lone surrogates, which the stdlib
+            # json writes; let it parse (or raise on) anything orjson refused.
+            return json.loads(data)
+    if _jiter is not None:
+        try:
+            return _jiter.from_json(data.encode("utf-8") if isinstance(data, str) else data)
+        except ValueError:
+            # jiter raises a plain ValueError; re-parse so callers always see
+            # json.JSONDecodeError (or the stdlib's result for NaN etc.).
+            return json.loads(data)
+    return json.loads(data)
+
+
+def dumps_bytes(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize obj to UTF-8 JSON bytes.
+
+    Non-ASCII text is written as-is (ensure_ascii=False); indent=True uses
+    two-space indentation.
+    """
+    if _orjson is not None:
+        return _orjson.dumps(obj, option=_orjson.OPT_INDENT_2 if indent else 0)
+    return (_encode_indent if indent else _encode_compact)(obj).encode("utf-8")
+
+
+def dumps(obj: Any, indent: bool = False) -> str:
+    """Serialize obj to a JSON str (see dumps_bytes)."""
+    return dumps_bytes(obj, indent=indent).decode("utf-8")
@@ -1,39 +1,66 @@
 """JSONL read/write helpers for WGU Reddit Analyzer."""
 
 from pathlib import Path
-import json, os
+import os
+
+from .json_utils import dumps_bytes, loads
+
+
+# Records encoded per writelines() call; bounds memory on large writes.
+_WRITE_BATCH = 8192
+
+
+def _write_records(f, records) -> int:
+    """Encode records as JSON lines and write them in batches; return count."""
+    n = 0
+    batch = []
+    for r in records or []:
+        batch.append(dumps_bytes(r) + b"\n")
+        if len(batch) >= _WRITE_BATCH:
+            f.writelines(batch)
+            n += len(batch)
+            batch.clear()
+    f.writelines(batch)
+    return n + len(batch)
 
 
 def write_jsonl(records, path: Path) -> int:
     """Write list of records to a JSONL file (overwrite)."""
     path = Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
-    n = 0
-    with path.open("w", encoding="utf-8") as f:
-        for r in records or []:
-            f.write(json.dumps(r, ensure_ascii=False) + "\n")
-            n += 1
-    return n
+    with path.open("wb") as f:
+        return _write_records(f, records)
 
 
-def append_jsonl(records, path: Path) -> int:
-    """Append list of records to a JSONL file (syncs to disk)."""
+def append_jsonl(records, path: Path, fsync: bool = True) -> int:
+    """
+    Append list of records to a JSONL file.
+
+    With fsync=True (default) the data is synced to disk before returning;
+    bulk writers that append many batches can pass False and rely on the
+    OS to flush.
+    """
     path = Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
-    n = 0
-    with path.open("a", encoding="utf-8") as f:
-        for r in records or []:
-            f.write(json.dumps(r, ensure_ascii=False) + "\n")
-            n += 1
-        f.flush()
-        os.fsync(f.fileno())
+    with path.open("ab") as f:
+        n = _write_records(f, records)
+        if fsync:
+            f.flush()
+            os.fsync(f.fileno())
     return n
 
 
-def read_jsonl(path: Path):
-    """Read JSONL file into list of dicts."""
+def iter_jsonl(path: Path):
+    """Yield records from a JSONL file one at a time (nothing if missing)."""
     path = Path(path)
     if not path.exists():
-        return []
-    with path.open("r", encoding="utf-8") as f:
-        return [json.loads(line) for line in f if line.strip()]
\ No newline at end of file
+        return
+    with path.open("rb") as f:
+        for line in f:
+            if line.strip():
+                yield loads(line)
+
+
+def read_jsonl(path: Path):
+    """Read JSONL file into list of dicts."""
+    return list(iter_jsonl(path))
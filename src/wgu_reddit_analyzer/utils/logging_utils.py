@@ -1,16 +1,80 @@
 from __future__ import annotations
 import logging
+import multiprocessing
+import os
+from logging.handlers import MemoryHandler, RotatingFileHandler
 from pathlib import Path
 
 REPO_ROOT = Path(__file__).resolve().parents[3]
 LOG_DIR = REPO_ROOT / "logs"
 LOG_DIR.mkdir(parents=True, exist_ok=True)
 
+_FMT = logging.Formatter(
+    "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
+)
+
+# One buffered, rotating file handler shared by every logger.
+_file_handler: logging.Handler | None = None
+
+
+class _PipelineLogHandler(MemoryHandler):
+    """
+    MemoryHandler that writes straight through in child processes.
+
+    Pool workers exit via os._exit, skipping logging.shutdown, so anything
+    they buffered would be lost. In a child each record goes to a plain,
+    non-rotating handler on the same file; only the main process rotates.
+    """
+
+    def __init__(self, target: logging.Handler) -> None:
+        super().__init__(capacity=1024, flushLevel=logging.WARNING, target=target)
+        self._child_pid: int | None = None
+        self._child_target: logging.Handler | None = None
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if multiprocessing.parent_process() is None:
+            super().emit(record)
+            return
+        with self.lock:
+            if self._child_pid != os.getpid():
+                # A forked worker inherits the parent's unflushed records;
+                # the parent writes those itself.
+                self.buffer = []
+                child_target = logging.FileHandler(
+                    LOG_DIR / "pipeline.log", encoding="utf-8", delay=True
+                )
+                child_target.setFormatter(_FMT)
+                self._child_target = child_target
+                self._child_pid = os.getpid()
+        self._child_target.handle(record)
+
+
+def _shared_file_handler() -> logging.Handler:
+    """
+    Return the process-wide handler for logs/pipeline.log.
+
+    In the main process records are buffered and written in batches (flushed
+    every 1024 records, on WARNING or above, and at interpreter exit by
+    logging.shutdown); worker processes write every record immediately.
+    """
+    global _file_handler
+    if _file_handler is None:
+        target = RotatingFileHandler(
+            LOG_DIR / "pipeline.log",
+            maxBytes=10_000_000,
+            backupCount=5,
+            encoding="utf-8",
+        )
+        target.setFormatter(_FMT)
+        _file_handler = _PipelineLogHandler(target)
+    return _file_handler
+
 
 def get_logger(name: str) -> logging.Logger:
     """
     Canonical logger:
-    - Writes to logs/<name>.log
+    - Writes to logs/pipeline.log (shared, rotating; the logger name is in
+      every line)
     - Also logs to stderr
     - Idempotent (no duplicate handlers)
     """
@@ -20,17 +84,11 @@ def get_logger(name: str) -> logging.Logger:
 
     logger.setLevel(logging.INFO)
 
-    fmt = logging.Formatter(
-        "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
-    )
-
-    fh = logging.FileHandler(LOG_DIR / f"{name}.log", encoding="utf-8")
-    fh.setFormatter(fmt)
-    logger.addHandler(fh)
+    logger.addHandler(_shared_file_handler())
 
     sh = logging.StreamHandler()
-    sh.setFormatter(fmt)
+    sh.setFormatter(_FMT)
     logger.addHandler(sh)
 
     logger.propagate = False
-    return logger
\ No newline at end of file
+    return logger
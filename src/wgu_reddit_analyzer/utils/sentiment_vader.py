@@ -1,5 +1,14 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
 _analyzer = None
 
+# Below this many texts per worker, process startup and lexicon loading
+# cost more than the scoring they offload.
+MIN_TEXTS_PER_WORKER = 2_000
+
 def _get():
     global _analyzer
     if _analyzer is None:
@@ -14,3 +23,33 @@ def calculate_vader_sentiment(text: str) -> float:
     if not text:
         return 0.0
     return _get().polarity_scores(text)["compound"]
+
+def _compound_chunk(texts):
+    return [calculate_vader_sentiment(t) for t in texts]
+
+def calculate_vader_sentiment_batch(texts, n_jobs: int = 1) -> np.ndarray:
+    """
+    Compound scores for texts as a float64 array (0.0 for empty text).
+
+    Repeated texts (reposts, cross-posts) are scored once. VADER scoring is
+    pure Python, so n_jobs > 1 splits the distinct texts across worker
+    processes (n_jobs <= 0 uses every CPU), never giving a worker fewer than
+    MIN_TEXTS_PER_WORKER texts; each worker loads the lexicon once.
+    """
+    texts = list(texts)
+    unique = list(dict.fromkeys(texts))
+    workers = (os.cpu_count() or 1) if n_jobs <= 0 else n_jobs
+    workers = min(workers, len(unique) // MIN_TEXTS_PER_WORKER)
+    if workers <= 1:
+        scores = _compound_chunk(unique)
+    else:
+        chunks = [unique[i::workers] for i in range(workers)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            parts = list(executor.map(_compound_chunk, chunks))
+        scores = [0.0] * len(unique)
+        for i, part in enumerate(parts):
+            scores[i::workers] = part
+    if len(unique) < len(texts):
+        by_text = dict(zip(unique, scores))
+        scores = [by_text[t] for t in texts]
+    return np.fromiter(scores, dtype=np.float64, count=len(texts))
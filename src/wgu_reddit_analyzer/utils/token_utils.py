@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import math
+import os
 from functools import lru_cache
 
 
@@ -65,6 +66,7 @@ def count_tokens_batch(texts: list[str], model: str = "gpt-5-mini") -> list[int]
     Count tokens for a list of strings.
 
     - Reuses a shared encoding when possible.
+    - Encodes all non-empty strings in one threaded tiktoken batch call.
     - Falls back per-string if needed.
     """
     if not texts:
@@ -74,6 +76,19 @@ def count_tokens_batch(texts: list[str], model: str = "gpt-5-mini") -> list[int]
     out: list[int] = []
 
     if enc is not None:
+        nonempty = [i for i, t in enumerate(texts) if t]
+        try:
+            encoded = enc.encode_ordinary_batch(
+                [texts[i] for i in nonempty], num_threads=os.cpu_count() or 4
+            )
+        except Exception:
+            encoded = None
+        if encoded is not None:
+            out = [0] * len(texts)
+            for i, tokens in zip(nonempty, encoded):
+                out[i] = len(tokens)
+            return out
+
         for t in texts:
             if not t:
                 out.append(0)
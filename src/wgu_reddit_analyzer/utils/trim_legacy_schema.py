@@ -19,6 +19,15 @@ KEEP_TABLES = {
     "run_log",
 }
 
+# The clean DB is a fresh file that create_clean_copy deletes if the copy
+# fails, so the copy runs without a rollback journal or fsyncs.
+_BULK_PRAGMAS = (
+    "PRAGMA journal_mode=OFF;",
+    "PRAGMA synchronous=OFF;",
+    "PRAGMA temp_store=MEMORY;",
+    "PRAGMA cache_size=-262144;",
+)
+
 
 def _get_tables(conn: sqlite3.Connection) -> list[str]:
     cur = conn.execute(
@@ -40,11 +49,17 @@ def create_clean_copy(src: Path = SRC_DB, dest: Path = DEST_DB) -> None:
 
     src_conn = sqlite3.connect(src)
     src_conn.row_factory = sqlite3.Row
-    dest_conn = sqlite3.connect(dest)
+    # Autocommit mode: the whole copy is one explicit transaction below.
+    dest_conn = sqlite3.connect(dest, isolation_level=None)
 
     try:
         src_tables = set(_get_tables(src_conn))
 
+        for pragma in _BULK_PRAGMAS:
+            dest_conn.execute(pragma)
+        dest_conn.execute("ATTACH DATABASE ? AS src;", (str(src),))
+        dest_conn.execute("BEGIN;")
+
         # 1) Create schemas in dest cloned from src for kept tables
         for table in sorted(KEEP_TABLES & src_tables):
             cur = src_conn.execute(
@@ -61,9 +76,9 @@ def create_clean_copy(src: Path = SRC_DB, dest: Path = DEST_DB) -> None:
             dest_conn.execute(create_sql)
             print(f"[OK] Created table {table} in clean DB.")
 
-        dest_conn.commit()
-
-        # 2) Copy rows
+        # 2) Copy rows inside SQLite: the source is attached to dest and each
+        #    table is copied with INSERT ... SELECT, so rows never pass
+        #    through Python.
         for table in sorted(KEEP_TABLES & src_tables):
             cols = [
                 r[1]
@@ -73,28 +88,32 @@ def create_clean_copy(src: Path = SRC_DB, dest: Path = DEST_DB) -> None:
                 continue
 
             cols_csv = ", ".join(cols)
-            placeholders = ", ".join(["?"] * len(cols))
+            copied = dest_conn.execute(
+                f"INSERT INTO main.{table} ({cols_csv}) SELECT {cols_csv} FROM src.{table};"
+            ).rowcount
 
-            rows = src_conn.execute(
-                f"SELECT {cols_csv} FROM {table};"
-            ).fetchall()
-
-            if not rows:
+            if not copied:
                 print(f"[OK] {table}: no rows to copy.")
                 continue
+            print(f"[OK] {table}: copied {copied} rows.")
 
-            dest_conn.executemany(
-                f"INSERT INTO {table} ({cols_csv}) VALUES ({placeholders})",
-                ([row[c] for c in cols] for row in rows),
-            )
-            dest_conn.commit()
-            print(f"[OK] {table}: copied {len(rows)} rows.")
+        dest_conn.execute("COMMIT;")
+        dest_conn.execute("DETACH DATABASE src;")
+        dest_conn.execute("PRAGMA synchronous=NORMAL;")
+        dest_conn.execute("PRAGMA journal_mode=WAL;")
 
         print(f"\nClean DB created at: {dest}")
         print("Tables included:")
         for t in sorted(KEEP_TABLES & src_tables):
             print(f"  - {t}")
 
+    except BaseException:
+        # Without a journal a failed copy can leave a corrupt file; remove it
+        # so the next run starts from scratch instead of refusing.
+        dest_conn.close()
+        for suffix in ("", "-wal", "-shm", "-journal"):
+            dest.with_name(dest.name + suffix).unlink(missing_ok=True)
+        raise
     finally:
         src_conn.close()
         dest_conn.close()